@@ -1,4 +1,23 @@
 # core/elo.py
+from typing import Optional
+
+
+def elo_update(winner_rating: float, loser_rating: float, k_factor: float) -> tuple:
+    """
+    New ratings after a decisive game, without building a Rating object.
+
+    Args:
+        winner_rating: Current rating of the winner
+        loser_rating: Current rating of the loser
+        k_factor: Maximum rating change per game
+
+    Returns:
+        (new winner rating, new loser rating)
+    """
+    # The winner gains exactly what the loser drops
+    expected = 1 / (1 + 10 ** ((loser_rating - winner_rating) / 400))
+    delta = k_factor * (1 - expected)
+    return winner_rating + delta, loser_rating - delta
 
 
 class Rating:
@@ -6,6 +25,9 @@ class Rating:
     Calculates ratings based on the ELO system used in chess.
     """
 
+    __slots__ = ('k_factor', '_rating_a', '_rating_b', '_score_a', '_score_b',
+                 '_expected_a', '_expected_b', '_new_rating_a', '_new_rating_b')
+
     KFACTOR = 16
 
     WIN = 1
@@ -21,6 +43,7 @@ class Rating:
             rating_b: Current rating of player B
             score_a: Score of player A (1 for win, 0.5 for draw, 0 for loss)
             score_b: Score of player B (1 for win, 0.5 for draw, 0 for loss)
+            k_factor: Maximum rating change per game
         """
         self.k_factor = k_factor
         self._rating_a = rating_a
@@ -40,7 +63,8 @@ class Rating:
         self._new_rating_a = new_ratings['a']
         self._new_rating_b = new_ratings['b']
 
-    def set_new_settings(self, rating_a: float, rating_b: float, score_a: float, score_b: float) -> 'Rating':
+    def set_new_settings(self, rating_a: float, rating_b: float, score_a: float, score_b: float,
+                         k_factor: Optional[float] = None) -> 'Rating':
         """
         Update the rating calculator with new values.
 
@@ -49,11 +73,13 @@ class Rating:
             rating_b: Current rating of player B
             score_a: Score of player A
             score_b: Score of player B
+            k_factor: New K-factor (defaults to the current one)
 
         Returns:
             self for method chaining
         """
-        self.__init__(rating_a, rating_b, score_a, score_b)
+        self.__init__(rating_a, rating_b, score_a, score_b,
+                      self.k_factor if k_factor is None else k_factor)
         return self
 
     def get_new_ratings(self) -> dict:
@@ -80,7 +106,8 @@ class Rating:
             Dictionary containing expected scores for both players
         """
         expected_score_a = 1 / (1 + (10 ** ((rating_b - rating_a) / 400)))
-        expected_score_b = 1 / (1 + (10 ** ((rating_a - rating_b) / 400)))
+        # The two expectations always sum to 1; saves a second power
+        expected_score_b = 1 - expected_score_a
 
         return {
             'a': expected_score_a,
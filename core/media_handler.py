@@ -1,22 +1,58 @@
 import os
+from collections import OrderedDict
+from enum import IntEnum
 from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 import cv2
 from PIL import Image
 from PIL.ImageQt import ImageQt
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPixmap, QMovie
+from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtGui import QPixmap, QPixmapCache, QMovie, QGuiApplication, QImageReader
 from PyQt6.QtWidgets import QLabel, QSizePolicy
 
-from core.video_player import VideoPlayer
 from core.media_utils import AspectRatioWidget, add_play_button_overlay
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# QPixmapCache budget (KB) for decoded preview images. The cache evicts by
+# size, so memory stays bounded no matter how large individual photos are.
+PIXMAP_CACHE_LIMIT_KB = 200 * 1024
+
+# Released video players kept for reuse. Building a QMediaPlayer pipeline is
+# expensive; two covers the outgoing pair of the voting tab.
+VIDEO_PLAYER_POOL_SIZE = 2
+
+# Released GIF movies kept for reuse, most recently used last. Each holds an
+# open file and its current frame, so the cache stays small.
+GIF_MOVIE_CACHE_SIZE = 8
+
+
+class MediaKind(IntEnum):
+    IMAGE = 0
+    GIF = 1
+    VIDEO = 2
+
+
+class LoadedMedia(NamedTuple):
+    """A media widget as built by MediaHandler, tagged with its kind."""
+    kind: MediaKind
+    widget: AspectRatioWidget
+    # QMovie for animated GIFs, QMediaPlayer for videos with a player, else None
+    player: Optional[object] = None
+
+
 class ScalableLabel(QLabel):
+    # Size changes smaller than this (in px) keep the current scaled pixmap
+    # as long as it still covers the label; the result is visually identical.
+    RESCALE_THRESHOLD = 8
+    # While resizing, scale with the fast transform and re-render smoothly
+    # once no resize event arrived for this long (ms).
+    SMOOTH_SETTLE_MS = 150
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(1, 1)
@@ -30,31 +66,95 @@ class ScalableLabel(QLabel):
         self._original_pixmap = None
         self._original_size = None
         self._aspect_ratio = None
+        self._scaled_for = None  # (label w, h) of the last rescale
+        self._scaled_size = None  # (w, h) of the current scaled pixmap
+        self._scaled_smooth = False  # Whether the current scaled pixmap is final quality
+        self._settle_timer = None  # Created on the first resize
         self.setStyleSheet("background-color: black;")  # Add this line
 
+    def reset_source(self):
+        """Forget the current pixmap so the next one defines the aspect ratio."""
+        self._original_pixmap = None
+        self._original_size = None
+        self._aspect_ratio = None
+        self._scaled_for = None
+
     def setPixmap(self, pixmap):
-        self._original_pixmap = pixmap
+        self._scaled_for = None
         if not self._original_size:
             self._original_size = pixmap.size()
             if self._original_size.width() > 0 and self._original_size.height() > 0:
                 self._aspect_ratio = self._original_size.width() / self._original_size.height()
             else:
                 self._aspect_ratio = 1
+        self._original_pixmap = self._bounded_to_screen(pixmap)
         self._update_scaled_pixmap()
 
+    def source_pixmap(self):
+        """The pixmap all scaled renderings are produced from."""
+        return self._original_pixmap
+
+    @staticmethod
+    def screen_pixel_limit():
+        """Longest edge, in device pixels, a label can ever need (None without a screen)."""
+        screen = QGuiApplication.primaryScreen()
+        if screen is None:
+            return None
+        geometry = screen.geometry()
+        return int(max(geometry.width(), geometry.height()) * screen.devicePixelRatio())
+
+    @staticmethod
+    def _bounded_to_screen(pixmap):
+        """
+        Downscale a pixmap larger than the screen once, so every later resize
+        resamples from a screen-sized master instead of the full image.
+        """
+        limit = ScalableLabel.screen_pixel_limit()
+        if limit is None or pixmap.isNull():
+            return pixmap
+        if pixmap.width() <= limit and pixmap.height() <= limit:
+            return pixmap
+        return pixmap.scaled(
+            limit, limit,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._update_scaled_pixmap()
-
-    def _update_scaled_pixmap(self):
+        if self._original_pixmap is None:
+            return
+        if self._settle_timer is None:
+            self._settle_timer = QTimer(self)
+            self._settle_timer.setSingleShot(True)
+            self._settle_timer.timeout.connect(self._update_scaled_pixmap)
+        self._update_scaled_pixmap(fast=True)
+        self._settle_timer.start(self.SMOOTH_SETTLE_MS)
+
+    def _update_scaled_pixmap(self, fast=False):
         if self._original_pixmap:
             available_size = self.size()
-            # Calculate the scaled size while maintaining aspect ratio
+            width, height = available_size.width(), available_size.height()
+            if self._scaled_for is not None and (fast or self._scaled_smooth):
+                last_width, last_height = self._scaled_for
+                scaled_width, scaled_height = self._scaled_size
+                if (abs(width - last_width) < self.RESCALE_THRESHOLD
+                        and abs(height - last_height) < self.RESCALE_THRESHOLD
+                        and scaled_width >= width and scaled_height >= height):
+                    return
+            # Calculate the scaled size while maintaining aspect ratio. Scale to
+            # device pixels so HiDPI screens show it 1:1 instead of upscaling.
+            dpr = self.devicePixelRatioF()
             scaled_pixmap = self._original_pixmap.scaled(
-                available_size,
+                available_size * dpr,
                 Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
+                Qt.TransformationMode.FastTransformation if fast
+                else Qt.TransformationMode.SmoothTransformation
             )
+            scaled_pixmap.setDevicePixelRatio(dpr)
+            self._scaled_for = (width, height)
+            self._scaled_size = (int(scaled_pixmap.width() / dpr), int(scaled_pixmap.height() / dpr))
+            self._scaled_smooth = not fast
             super().setPixmap(scaled_pixmap)
 
     def get_aspect_ratio(self):
@@ -113,11 +213,45 @@ class MediaHandler:
     def __init__(self):
         """Initialize the media handler."""
         self.active_video_players = []
+        self._video_player_pool = []
+        self._gif_movie_cache = OrderedDict()  # path -> stopped QMovie (file mtime in its "mtime" property)
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_LIMIT_KB))
+
+    @staticmethod
+    def _file_mtime(file_path: str):
+        """Modification time used to key caches, or None if the file is gone."""
+        try:
+            return os.stat(file_path).st_mtime
+        except OSError:
+            return None
 
     @staticmethod
-    @lru_cache(maxsize=100)
     def _load_pixmap_cached(image_path: str) -> QPixmap:
-        return QPixmap(image_path)
+        """Load an image as a screen-bounded pixmap, reusing earlier decodes."""
+        # The mtime keeps an edited or replaced file from being served stale
+        key = f"kura:image:{image_path}:{MediaHandler._file_mtime(image_path)}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            # Cache the screen-bounded pixmap: it is all a label ever displays
+            pixmap = ScalableLabel._bounded_to_screen(MediaHandler._read_pixmap_scaled(image_path))
+            if not pixmap.isNull():
+                QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def _read_pixmap_scaled(image_path: str) -> QPixmap:
+        """
+        Decode an image no larger than the screen. JPEG decoders scale while
+        decoding, so a large photo never exists at full resolution in memory.
+        """
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)  # Respect EXIF orientation
+        limit = ScalableLabel.screen_pixel_limit()
+        size = reader.size()
+        if limit is not None and size.isValid() and (size.width() > limit or size.height() > limit):
+            # Target the unrotated size: EXIF rotation is applied after scaling
+            reader.setScaledSize(size.scaled(limit, limit, Qt.AspectRatioMode.KeepAspectRatio))
+        return QPixmap.fromImage(reader.read())
 
     @staticmethod
     @lru_cache(maxsize=1000)
@@ -161,60 +295,63 @@ class MediaHandler:
         else:
             return 'unknown'
 
-    def load_media(self, file_path: str):
-        """Load media file and return appropriate widget."""
+    def load_media(self, file_path: str) -> Optional[LoadedMedia]:
+        """Load media file and return it as LoadedMedia (None if it cannot be shown)."""
         ext = os.path.splitext(file_path)[1].lower()
 
-        # Get aspect ratio from image
-        aspect_ratio = self._get_aspect_ratio_cached(file_path)  # Use cached
-
         # Handle different media types
+        player = None
         if ext == '.gif':
-            widget, movie = self._load_gif(file_path)
+            aspect_ratio = self._get_aspect_ratio_cached(file_path)
+            widget, player = self._load_gif(file_path)
+            # A GIF Qt cannot animate is shown as a still image
+            kind = MediaKind.GIF if player else MediaKind.IMAGE
         elif ext in ['.jpg', '.jpeg', '.png', '.webp']:
             widget = self._load_image(file_path)
+            # Take the ratio from the decoded pixmap instead of opening the file again
+            aspect_ratio = widget.get_aspect_ratio() if widget else None
+            kind = MediaKind.IMAGE
         elif ext in ['.mp4', '.avi', '.m4v', '.wmv', '.mov', '.mkv', '.webm']:
+            aspect_ratio = self._get_aspect_ratio_cached(file_path)
             widget, player = self._create_video_widget(file_path)
+            kind = MediaKind.VIDEO
         else:
             return None
 
         # Wrap in aspect ratio maintainer
         if widget:
-            wrapped_widget = AspectRatioWidget(widget, aspect_ratio)
-            if ext == '.gif':
-                return wrapped_widget, movie
-            elif ext in ['.mp4', '.avi', '.m4v', '.wmv', '.mov', '.mkv', '.webm']:
-                return wrapped_widget, player
-            return wrapped_widget
+            return LoadedMedia(kind, AspectRatioWidget(widget, aspect_ratio), player)
         return None
 
-    def load_media_from_result(self, result):
+    def load_media_from_result(self, result, create_player=False) -> Optional[LoadedMedia]:
         """
         Build a grid widget from a preloaded MediaLoadResult without touching
         the disk on the main thread.
 
-        Returns the same shapes as load_media():
-        - image: AspectRatioWidget
-        - gif: (AspectRatioWidget, QMovie) or AspectRatioWidget when the GIF is invalid
-        - video: AspectRatioWidget showing the thumbnail with a play overlay
-          (the actual VideoPlayer is created lazily by the caller)
+        Returns LoadedMedia like load_media(). Videos get a thumbnail with a
+        play overlay and no player (the VideoPlayer is created lazily by the
+        caller) unless create_player is True.
         """
         if result.media_type == 'gif':
-            widget, movie = self._load_gif(result.file_path)
+            widget, movie = self._load_gif(result.file_path, result.modified_time)
             if widget is None:
                 return None
-            wrapped = AspectRatioWidget(widget, result.aspect_ratio)
-            return (wrapped, movie) if movie else wrapped
+            kind = MediaKind.GIF if movie else MediaKind.IMAGE
+            return LoadedMedia(kind, AspectRatioWidget(widget, result.aspect_ratio), movie)
 
         if result.media_type == 'video':
-            return self._create_video_thumbnail_widget(result)
+            if create_player:
+                # Reuse the frame grabbed by the loader instead of grabbing it again here
+                widget, player = self._create_video_widget(result.file_path, thumbnail=result.thumbnail)
+                return LoadedMedia(MediaKind.VIDEO, AspectRatioWidget(widget, result.aspect_ratio), player)
+            return LoadedMedia(MediaKind.VIDEO, self._create_video_thumbnail_widget(result))
 
         # Images (and unknown types fall back to a full main-thread load)
         if result.thumbnail is not None and not result.thumbnail.isNull():
             pixmap = QPixmap.fromImage(result.thumbnail)
             label = ScalableLabel()
             label.setPixmap(pixmap)
-            return AspectRatioWidget(label, result.aspect_ratio)
+            return LoadedMedia(MediaKind.IMAGE, AspectRatioWidget(label, result.aspect_ratio))
         return self.load_media(result.file_path)
 
     def _create_video_thumbnail_widget(self, result):
@@ -239,9 +376,26 @@ class MediaHandler:
         """
         return self._create_video_widget(file_path)
 
-    def _load_gif(self, gif_path: str):
-        """Load animated GIF and return ScalableMovie with QMovie."""
-        movie = QMovie(gif_path)
+    def _load_gif(self, gif_path: str, mtime=None):
+        """
+        Load animated GIF and return ScalableMovie with QMovie.
+
+        mtime: the file's st_mtime if the caller already has it
+        """
+        if mtime is None:
+            mtime = self._file_mtime(gif_path)
+        movie = self._gif_movie_cache.pop(gif_path, None)
+        if movie is not None and movie.property("mtime") != mtime:
+            # The file changed since this movie decoded it
+            self._discard_gif_movie(movie)
+            movie = None
+        if movie is not None:
+            # Back to the first frame at full size, as a new movie would be
+            movie.setScaledSize(QSize())
+            movie.jumpToFrame(0)
+        else:
+            movie = QMovie(gif_path)
+            movie.setProperty("mtime", mtime)
         if movie.isValid():
             label = ScalableMovie()
             label.setMovie(movie)
@@ -271,15 +425,16 @@ class MediaHandler:
             return label
         return None
 
-    def _create_video_widget(self, video_path: str):
-        """Create and return video widget."""
+    def _create_video_widget(self, video_path: str, thumbnail=None):
+        """Create and return video widget (thumbnail: optional pre-grabbed QImage)."""
         logger.info(f"Creating video widget for: {video_path}")
-        video_player = VideoPlayer()
+        if self._video_player_pool:
+            video_player = self._video_player_pool.pop()
+        else:
+            video_player = self._new_video_player()
         self.active_video_players.append(video_player)
-        # Auto-remove from list when player is destroyed
-        video_player.destroyed.connect(lambda: self.cleanup_player(video_player))
         try:
-            video_player.set_source(video_path)
+            video_player.set_source(video_path, thumbnail=thumbnail)
             logger.info(f"Successfully created video player for: {video_path}")
             return video_player, video_player.media_player
         except Exception as e:
@@ -287,6 +442,66 @@ class MediaHandler:
             self.cleanup_player(video_player)
             raise
 
+    def _new_video_player(self):
+        # Qt Multimedia is only loaded once the first video is needed
+        from core.video_player import VideoPlayer
+        video_player = VideoPlayer()
+        # Auto-remove from list when player is destroyed
+        video_player.destroyed.connect(lambda: self.cleanup_player(video_player))
+        return video_player
+
+    def prewarm_video_player(self):
+        """
+        Build a VideoPlayer ahead of time if none is pooled, so the next video
+        does not pay for loading Qt Multimedia and creating a player pipeline.
+        """
+        if not self._video_player_pool:
+            self._video_player_pool.append(self._new_video_player())
+
+    def release_video_player(self, video_player):
+        """
+        Take back a VideoPlayer that is no longer displayed.
+
+        The player is detached from its parent and kept for reuse by the next
+        video, or deleted when the pool is full.
+        """
+        self.cleanup_player(video_player)
+        # Unload the source now rather than when deleteLater runs, so the old
+        # decoder buffers are gone before the next pair's media is built
+        video_player.reset()
+        if len(self._video_player_pool) >= VIDEO_PLAYER_POOL_SIZE:
+            video_player.deleteLater()
+            return
+        video_player.setParent(None)
+        self._video_player_pool.append(video_player)
+
+    def release_gif_movie(self, movie):
+        """
+        Take back a QMovie that is no longer displayed and keep it for the
+        next time the same GIF is shown, evicting the least recently used.
+        """
+        movie.stop()
+        path = movie.fileName()
+        if not path:
+            self._discard_gif_movie(movie)
+            return
+        previous = self._gif_movie_cache.pop(path, None)
+        if previous is not None and previous is not movie:
+            self._discard_gif_movie(previous)
+        self._gif_movie_cache[path] = movie
+        while len(self._gif_movie_cache) > GIF_MOVIE_CACHE_SIZE:
+            _, evicted = self._gif_movie_cache.popitem(last=False)
+            self._discard_gif_movie(evicted)
+
+    @staticmethod
+    def _discard_gif_movie(movie):
+        """Drop a QMovie's cached frames right away, then delete it."""
+        movie.stop()
+        # Resetting the file name frees the decoded frames synchronously;
+        # deleteLater alone keeps them alive until the next event loop pass
+        movie.setFileName("")
+        movie.deleteLater()
+
     def pause_all_videos(self):
         logger.info("Pausing all active video players.")
         """Pause all active video players."""
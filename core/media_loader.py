@@ -1,6 +1,7 @@
 import logging
 import multiprocessing
 import os
+from collections import OrderedDict
 from queue import Queue, Empty
 from threading import Thread, Lock
 
@@ -15,6 +16,9 @@ logger = logging.getLogger(__name__)
 # much faster than decoding full resolution and scaling afterwards.
 THUMBNAIL_MAX_SIZE = 640
 
+# Upper bound for decoded images kept by DecodedImageCache, in bytes
+DECODED_CACHE_BYTES = 256 * 1024 * 1024
+
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
 GIF_EXTENSIONS = {'.gif'}
 VIDEO_EXTENSIONS = {'.mp4', '.m4v', '.wmv', '.avi', '.mov', '.mkv', '.webm'}
@@ -43,6 +47,53 @@ class MediaLoadResult:
         self.exists = False
 
 
+class DecodedImageCache:
+    """
+    Thread-safe LRU of decoded QImages, bounded by total size in bytes.
+
+    Keys include the file's mtime so an edited file is never served stale.
+    QImage is implicitly shared, so handing the same image to several
+    consumers does not copy pixel data.
+    """
+
+    def __init__(self, max_bytes=DECODED_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (QImage, aspect_ratio)
+        self._bytes = 0
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, image, aspect_ratio):
+        size = image.sizeInBytes()
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[0].sizeInBytes()
+            self._entries[key] = (image, aspect_ratio)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted.sizeInBytes()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# Shared by all loaders: the voting pairs and the ranking grid often show
+# the same files again, and a hit skips disk I/O and decoding entirely.
+decoded_image_cache = DecodedImageCache()
+
+
 def _classify(file_path: str) -> str:
     ext = os.path.splitext(file_path)[1].lower()
     if ext in IMAGE_EXTENSIONS:
@@ -71,8 +122,13 @@ class ThreadedMediaLoader(QObject):
     all_media_loaded = pyqtSignal(int)  # generation
     progress_updated = pyqtSignal()
 
-    def __init__(self):
+    def __init__(self, max_size=THUMBNAIL_MAX_SIZE):
+        """
+        Args:
+            max_size: Longest edge images and video frames are decoded to
+        """
         super().__init__()
+        self.max_size = max_size
         self.generation = 0
         self._generation_lock = Lock()
         # Cap the decoder pool: more threads saturate the CPU and starve the
@@ -147,23 +203,35 @@ class ThreadedMediaLoader(QObject):
         except OSError:
             return result
 
-        if result.media_type == 'image':
-            self._load_image_thumbnail(result)
-        elif result.media_type == 'gif':
+        if result.media_type == 'gif':
             self._load_gif_info(result)
-        elif result.media_type == 'video':
-            self._load_video_thumbnail(result)
+            return result
+        if result.media_type not in ('image', 'video'):
+            return result
+
+        cache_key = (task.file_path, stat.st_mtime_ns, self.max_size)
+        cached = decoded_image_cache.get(cache_key)
+        if cached is not None:
+            result.thumbnail, result.aspect_ratio = cached
+            return result
+
+        if result.media_type == 'image':
+            self._load_image_thumbnail(result, self.max_size)
+        else:
+            self._load_video_thumbnail(result, self.max_size)
+        if result.thumbnail is not None and not result.thumbnail.isNull():
+            decoded_image_cache.put(cache_key, result.thumbnail, result.aspect_ratio)
         return result
 
     @staticmethod
-    def _load_image_thumbnail(result: MediaLoadResult):
+    def _load_image_thumbnail(result: MediaLoadResult, max_size: int = THUMBNAIL_MAX_SIZE):
         reader = QImageReader(result.file_path)
         reader.setAutoTransform(True)  # Respect EXIF orientation
         size = reader.size()
         if size.isValid() and size.width() > 0 and size.height() > 0:
-            if size.width() > THUMBNAIL_MAX_SIZE or size.height() > THUMBNAIL_MAX_SIZE:
+            if size.width() > max_size or size.height() > max_size:
                 reader.setScaledSize(size.scaled(
-                    THUMBNAIL_MAX_SIZE, THUMBNAIL_MAX_SIZE,
+                    max_size, max_size,
                     Qt.AspectRatioMode.KeepAspectRatio
                 ))
         image = reader.read()
@@ -171,7 +239,7 @@ class ThreadedMediaLoader(QObject):
             logger.warning(
                 f"QImageReader failed for {result.file_path}: {reader.errorString()}"
             )
-            image = ThreadedMediaLoader._load_image_via_pil(result.file_path)
+            image = ThreadedMediaLoader._load_image_via_pil(result.file_path, max_size)
         if not image.isNull():
             result.thumbnail = image
             # Compute from the decoded image: EXIF rotation may swap dimensions
@@ -179,13 +247,15 @@ class ThreadedMediaLoader(QObject):
                 result.aspect_ratio = image.width() / image.height()
 
     @staticmethod
-    def _load_image_via_pil(file_path: str) -> QImage:
+    def _load_image_via_pil(file_path: str, max_size: int = THUMBNAIL_MAX_SIZE) -> QImage:
         """Fallback decode with Pillow for formats QImageReader cannot handle."""
         try:
             from PIL import Image
             from PIL.ImageQt import ImageQt
             with Image.open(file_path) as img:
-                img.thumbnail((THUMBNAIL_MAX_SIZE, THUMBNAIL_MAX_SIZE))
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale (no-op for other formats)
+                img.draft('RGB', (max_size, max_size))
+                img.thumbnail((max_size, max_size))
                 # .copy() detaches from the PIL buffer, which is freed on close
                 return QImage(ImageQt(img.convert("RGBA"))).copy()
         except Exception as e:
@@ -208,13 +278,13 @@ class ThreadedMediaLoader(QObject):
                     result.aspect_ratio = image.width() / image.height()
 
     @staticmethod
-    def _load_video_thumbnail(result: MediaLoadResult):
+    def _load_video_thumbnail(result: MediaLoadResult, max_size: int = THUMBNAIL_MAX_SIZE):
         image, aspect_ratio = grab_video_frame(result.file_path)
         result.aspect_ratio = aspect_ratio
         if not image.isNull():
-            if image.width() > THUMBNAIL_MAX_SIZE or image.height() > THUMBNAIL_MAX_SIZE:
+            if image.width() > max_size or image.height() > max_size:
                 image = image.scaled(
-                    THUMBNAIL_MAX_SIZE, THUMBNAIL_MAX_SIZE,
+                    max_size, max_size,
                     Qt.AspectRatioMode.KeepAspectRatio,
                     Qt.TransformationMode.SmoothTransformation
                 )
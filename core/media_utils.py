@@ -1,12 +1,12 @@
 # core/media_utils.py
 import logging
 import os
-from datetime import datetime
+import time
+from functools import lru_cache
 
 import cv2
 from PyQt6.QtCore import Qt, QEvent
 from PyQt6.QtGui import QImage, QPixmap, QPainter, QColor, QPainterPath
-from PyQt6.QtMultimedia import QMediaPlayer
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 
 logger = logging.getLogger(__name__)
@@ -113,6 +113,8 @@ def handle_video_events(event, obj, single_click_timer, pending_video_click, sho
 def handle_video_single_click(pending_video_click):
     """Handle video play/pause logic (to be called from single-click timer)."""
     if pending_video_click:
+        # Imported here so image-only sessions never load Qt Multimedia
+        from PyQt6.QtMultimedia import QMediaPlayer
         media_player, _ = pending_video_click
         if media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             media_player.pause()
@@ -121,9 +123,16 @@ def handle_video_single_click(pending_video_click):
         pending_video_click.clear()
 
 class AspectRatioWidget(QWidget):
+    # Extra vertical space (px) given to letterboxed content on each side
+    VERTICAL_INSET = 18
+
     def __init__(self, widget, aspect_ratio=16/9, parent=None):
         super().__init__(parent)
         self.aspect_ratio = aspect_ratio
+        # (width, height, aspect ratio) the margins were last computed for,
+        # and the (horizontal, vertical) margins applied
+        self._margins_key = None
+        self._margins = (0, 0)
         self.setLayout(QVBoxLayout())
         self.layout().setContentsMargins(0, 0, 0, 0)
         self.layout().addWidget(widget)
@@ -131,21 +140,39 @@ class AspectRatioWidget(QWidget):
         widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
+    def set_aspect_ratio(self, aspect_ratio):
+        """Change the ratio of a widget that is being reused for new content."""
+        if aspect_ratio != self.aspect_ratio:
+            self.aspect_ratio = aspect_ratio
+            self._update_margins()
+
     def resizeEvent(self, event):
+        self._update_margins()
+        super().resizeEvent(event)
+
+    def _update_margins(self):
         width = self.width()
         height = self.height()
         target_aspect = self.aspect_ratio
+        # Resizes arrive in bursts while a window is dragged; most repeat
+        key = (width, height, target_aspect)
+        if key == self._margins_key:
+            return
+        self._margins_key = key
+
         current_aspect = width / height if height != 0 else 1
         if current_aspect > target_aspect:
             new_width = int(height * target_aspect)
             offset = (width - new_width) // 2
-            self.layout().setContentsMargins(offset, 0, offset, 0)
+            horizontal, vertical = offset, 0
         else:
             new_height = int(width / target_aspect)
             offset = (height - new_height) // 2
-            self.layout().setContentsMargins(0, offset -18, 0, offset - 18)
+            horizontal, vertical = 0, offset - self.VERTICAL_INSET
 
-        super().resizeEvent(event)
+        if (horizontal, vertical) != self._margins:
+            self._margins = (horizontal, vertical)
+            self.layout().setContentsMargins(horizontal, vertical, horizontal, vertical)
 
 def set_file_info(file_path, info_label, elide=False, max_width=150,
                   file_size=None, modified_time=None):
@@ -156,24 +183,16 @@ def set_file_info(file_path, info_label, elide=False, max_width=150,
     background loader), the file system is not touched at all.
     """
     if file_size is None or modified_time is None:
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)  # One syscall for existence, size and mtime
+        except OSError:
             info_label.setText(f"File not found: {file_path}")
             return
-        file_size = os.path.getsize(file_path)
-        modified_time = os.path.getmtime(file_path)
+        file_size = stat.st_size
+        modified_time = stat.st_mtime
 
     file_name = os.path.basename(file_path)
-
-    # Format file size
-    if file_size < 1024:
-        file_size_str = f"{file_size} B"
-    elif file_size < 1024 * 1024:
-        file_size_str = f"{file_size / 1024:.1f} KB"
-    else:
-        file_size_str = f"{file_size / (1024 * 1024):.1f} MB"
-
-    # Format modification date
-    mod_date = datetime.fromtimestamp(modified_time).strftime("%Y-%m-%d %H:%M:%S")
+    file_size_str, mod_date = _format_size_and_date(file_size, modified_time)
 
     # Elide file name if required
     if elide:
@@ -184,6 +203,35 @@ def set_file_info(file_path, info_label, elide=False, max_width=150,
         info_label.setText(f"{file_name}\n{file_size_str} | {mod_date}")
 
 
+@lru_cache(maxsize=4096)
+def _format_size_and_date(file_size, modified_time):
+    """
+    Human-readable size and modification date. Cached: the same items keep
+    reappearing in voting pairs and ranking pages.
+    """
+    # Same text as strftime("%Y-%m-%d %H:%M:%S") without a datetime object
+    t = time.localtime(modified_time)
+    mod_date = (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+    return _format_size(file_size), mod_date
+
+
+# (threshold, multiplier, unit), largest first; media files are mostly MBs
+_SIZE_UNITS = (
+    (1024 * 1024, 1 / (1024 * 1024), "MB"),
+    (1024, 1 / 1024, "KB"),
+)
+
+
+@lru_cache(maxsize=2048)
+def _format_size(file_size):
+    """Human-readable file size; cached separately as many files share a size."""
+    for threshold, multiplier, unit in _SIZE_UNITS:
+        if file_size >= threshold:
+            return f"{file_size * multiplier:.1f} {unit}"
+    return f"{file_size} B"
+
+
 def elide_text(text, max_width, label):
     """Elide text to fit within the specified width using the label's font metrics."""
     metrics = label.fontMetrics()
@@ -2,6 +2,7 @@ import os
 import sqlite3
 import logging
 from pathlib import Path
+from queue import Queue
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from db.database import Database, get_database_path
@@ -83,6 +84,139 @@ class MediaAddWorker(QThread):
             self.finished.emit(added_count, skipped_count)
 
 
+class PairRequest:
+    """A queued request for a voting pair, answered through pair_ready."""
+
+    def __init__(self, request_id: int, album_id: int):
+        self.request_id = request_id
+        self.album_id = album_id
+
+
+class AlbumStatsRequest:
+    """A queued request for an album's voting statistics, answered through album_stats_ready."""
+
+    def __init__(self, album_id: int):
+        self.album_id = album_id
+
+
+class VotingDatabaseWorker(QThread):
+    """
+    Long-lived worker thread that owns the voting tab's database traffic.
+
+    Rating updates and their commit (an fsync) and pair selection run here
+    instead of on the GUI thread. Votes and pair requests are handled strictly
+    in submission order through a single connection, so a pair is always
+    chosen from ratings that include every vote cast before it was requested.
+    """
+    vote_applied = pyqtSignal(int, object)  # album_id, mean Glicko phi (None for Elo)
+    vote_failed = pyqtSignal(int, str)  # album_id, error message
+    pair_ready = pyqtSignal(int, int, object)  # request_id, album_id, (left, right) or None
+    album_stats_ready = pyqtSignal(int, object)  # album_id, dict of counts or None (see _serve_album_stats)
+
+    def __init__(self, db_path=None):
+        super().__init__()
+        self.db_path = db_path or get_database_path()
+        self._queue = Queue()
+
+    def submit(self, winner_id: int, loser_id: int, album_id: int, weight: int = 1):
+        """Queue a vote; returns immediately."""
+        self._queue.put((winner_id, loser_id, album_id, weight))
+
+    def request_pair(self, request_id: int, album_id: int):
+        """Queue a pair selection for album_id; returns immediately."""
+        self._queue.put(PairRequest(request_id, album_id))
+
+    def request_album_stats(self, album_id: int):
+        """Queue reading album_id's media and vote counts; returns immediately."""
+        self._queue.put(AlbumStatsRequest(album_id))
+
+    def stop(self):
+        """Apply all queued votes, then end the thread."""
+        self._queue.put(None)
+        self.wait()
+
+    def run(self):
+        """Serve queued votes and pair requests until stop() is called."""
+        # Create a new database connection for this thread
+        db = Database(self.db_path)
+        try:
+            stopping = False
+            while not stopping:
+                # Block for one item, then drain whatever queued up meanwhile so
+                # a burst of fast votes is committed in a single transaction
+                items = [self._queue.get()]
+                while not self._queue.empty():
+                    items.append(self._queue.get_nowait())
+                batch = []
+                for item in items:
+                    if item is None:
+                        stopping = True
+                    elif isinstance(item, (PairRequest, AlbumStatsRequest)):
+                        # Commit earlier votes first so the answer reflects them
+                        if batch:
+                            self._apply_batch(db, batch)
+                            batch = []
+                        if stopping:
+                            continue
+                        if isinstance(item, PairRequest):
+                            self._serve_pair(db, item)
+                        else:
+                            self._serve_album_stats(db, item)
+                    else:
+                        batch.append(item)
+                if batch:
+                    self._apply_batch(db, batch)
+        finally:
+            db.close()
+
+    def _serve_pair(self, db, request):
+        try:
+            pair = db.get_pair_for_voting(request.album_id)
+        except Exception as e:
+            logger.error(f"Error selecting a pair for album {request.album_id}: {e}")
+            pair = None
+        self.pair_ready.emit(request.request_id, request.album_id, pair)
+
+    def _serve_album_stats(self, db, request):
+        album_id = request.album_id
+        try:
+            rating_system = db.get_album_rating_system(album_id) or "glicko2"
+            stats = {
+                'total_media': db.get_total_media_count(album_id),
+                'total_votes': db.get_total_votes(album_id),
+                'rating_system': rating_system,
+                'mean_phi': db.get_mean_glicko_phi(album_id) if rating_system != "elo" else None,
+                'has_videos': db.has_media_type(album_id, 'video'),
+            }
+        except Exception as e:
+            logger.error(f"Error reading statistics for album {album_id}: {e}")
+            stats = None
+        self.album_stats_ready.emit(album_id, stats)
+
+    def _apply_batch(self, db, batch):
+        try:
+            rating_systems = db.update_ratings_batch(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                winner_id, loser_id, album_id, _ = batch[0]
+                logger.error(f"Error applying vote {winner_id}>{loser_id}: {e}")
+                self.vote_failed.emit(album_id, str(e))
+                return
+            # Isolate the failing vote instead of dropping the whole burst
+            for vote in batch:
+                self._apply_batch(db, [vote])
+            return
+
+        # Read back what the voting tab needs on the same connection, so the
+        # GUI thread does not query for it after every vote
+        mean_phis = {}
+        for (_, _, album_id, _), rating_system in zip(batch, rating_systems):
+            if rating_system != "elo" and album_id not in mean_phis:
+                mean_phis[album_id] = db.get_mean_glicko_phi(album_id)
+        for _, _, album_id, _ in batch:
+            self.vote_applied.emit(album_id, mean_phis.get(album_id))
+
+
 class MissingFilesScanWorker(QThread):
     """
     Worker thread that checks whether media files still exist on disk.
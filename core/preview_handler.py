@@ -1,7 +1,6 @@
 # core/preview_handler.py
 from PyQt6.QtCore import Qt, QEvent, QTimer, QUrl
 from PyQt6.QtGui import QKeyEvent, QDesktopServices
-from PyQt6.QtMultimedia import QMediaPlayer
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QSizePolicy, QPushButton, QHBoxLayout, QWidget
 
 
@@ -135,14 +134,10 @@ class MediaPreview(QDialog):
         # Connect mouse press event
         self.media_container.mousePressEvent = lambda e: self.handle_click(e)
 
-        # Install event filter to track main window resize events
-        if self.parent():
-            self.parent().window().installEventFilter(self)
-
-        # Timer to track window movement
+        # Timer to track window movement; runs only while the preview is shown
         self.timer = QTimer(self)
+        self.timer.setInterval(10)
         self.timer.timeout.connect(self.check_window_position)
-        self.timer.start(10)  # Check every 100ms
 
         # Store the last known position of the main window
         self.last_window_position = None
@@ -205,6 +200,13 @@ class MediaPreview(QDialog):
         self.prev_button.setVisible(enable_navigation)
         self.next_button.setVisible(enable_navigation)
 
+        # Follow the main window while shown; close() undoes both, so the
+        # same dialog can be shown again later
+        if self.parent():
+            self.parent().window().installEventFilter(self)
+        if not self.timer.isActive():
+            self.timer.start()
+
         self.show()
         self.raise_()
         self.setFocus()
@@ -219,6 +221,7 @@ class MediaPreview(QDialog):
     def handle_video_click(self):
         """Handle single click on video preview (play/pause)"""
         if self.pending_video_click and self.video_player:
+            from PyQt6.QtMultimedia import QMediaPlayer
             if self.video_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
                 self.video_player.pause()
             else:
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from typing import Optional
 
 
@@ -96,6 +97,27 @@ class ReliabilityCalculator:
         Returns:
             int: Minimum votes required
         """
+        # The voting tab asks again after every vote. mean_phi moves with every
+        # Glicko vote, but a whole RD point shifts reliability by at most
+        # ~0.02%, well inside the search tolerance; rounding it lets
+        # consecutive votes share a cached answer. Elo ignores it.
+        if rating_system == "elo" or mean_phi is None:
+            mean_phi = None
+        else:
+            mean_phi = round(mean_phi)
+        return ReliabilityCalculator._required_votes(
+            n, target_reliability, rating_system, mean_phi
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _required_votes(
+        n: int,
+        target_reliability: float,
+        rating_system: str,
+        mean_phi: Optional[int],
+    ) -> int:
+        """Binary search over calculate_reliability behind calculate_required_votes"""
         if n <= 0 or target_reliability <= 50 or target_reliability >= 100:
             return 0
 
@@ -60,7 +60,7 @@ class VideoPlayer(QWidget):
     default_volume = DEFAULT_VOLUME
 
     @staticmethod
-    @lru_cache(maxsize=200)
+    @lru_cache(maxsize=32)
     def _get_video_thumbnail(file_path: str) -> QPixmap:
         """Cached thumbnail generation with fallback handling"""
         image, _ = grab_video_frame(file_path)
@@ -218,8 +218,8 @@ class VideoPlayer(QWidget):
                 self.media_player.play()
                 self._autoplay_pending = False
 
-    def set_source(self, path):
-        """Set the video source."""
+    def set_source(self, path, thumbnail=None):
+        """Set the video source (thumbnail: optional pre-grabbed QImage)."""
         url = QUrl.fromLocalFile(path)
         logger.info(f"Setting video source: {url.toString()}")
         
@@ -235,14 +235,17 @@ class VideoPlayer(QWidget):
         self._autoplay_pending = False  # Reset autoplay pending flag
 
         # Extract and display thumbnail
-        self.extract_and_display_thumbnail(path)
+        self.extract_and_display_thumbnail(path, thumbnail)
 
         # Connect the playback state signal to handle thumbnail visibility
         self.media_player.playbackStateChanged.connect(self.hide_thumbnail_on_play)
 
-    def extract_and_display_thumbnail(self, path):
+    def extract_and_display_thumbnail(self, path, thumbnail=None):
         """Display cached thumbnail with play button overlay"""
-        pixmap = self._get_video_thumbnail(path)
+        if thumbnail is not None and not thumbnail.isNull():
+            pixmap = QPixmap.fromImage(thumbnail)
+        else:
+            pixmap = self._get_video_thumbnail(path)
 
         if pixmap.isNull():
             # Create error thumbnail with overlay
@@ -330,7 +333,27 @@ class VideoPlayer(QWidget):
 
     def stop(self):
         """Stop video playback."""
-        self.media_player.stop()
+        if self.media_player.playbackState() != QMediaPlayer.PlaybackState.StoppedState:
+            self.media_player.stop()
+
+    def reset(self):
+        """Stop and unload the current video so the player can be reused."""
+        # Signals stay blocked while unloading: position_changed() would
+        # otherwise restart playback on the position reset
+        self.media_player.blockSignals(True)
+        if self.media_player.playbackState() != QMediaPlayer.PlaybackState.StoppedState:
+            self.media_player.stop()
+        self.media_player.setSource(QUrl())
+        self.media_player.blockSignals(False)
+        self._autoplay_pending = False
+        self._is_looping = False
+        self.video_widget.hide()
+        self.thumbnail_label.reset_source()
+        self.thumbnail_label.show()
+        self.position_slider.setRange(0, 0)
+        self.current_time_label.setText("00:00")
+        self.total_time_label.setText("00:00")
+        self.update_play_button(QMediaPlayer.PlaybackState.StoppedState)
 
     def pause(self) -> None:
         """Attempt to pause the media playback, silently ignore any failures."""
@@ -5,6 +5,7 @@ import sqlite3
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from core.elo import elo_update
 from core.reliability_calculator import ReliabilityCalculator
 
 logger = logging.getLogger(__name__)
@@ -279,64 +280,47 @@ class Database:
         return result[0] if result else "glicko2"
 
     def _recalculate_elo(self, album_id: int):
+        """Replay an Elo album's vote history in memory and write the result once."""
+        media_count = self.get_total_media_count(album_id)
+        ratings = {}
+        vote_counts = {}
+        self.cursor.execute("SELECT id FROM media WHERE album_id = ?", (album_id,))
+        for (media_id,) in self.cursor.fetchall():
+            ratings[media_id] = 1200.0
+            vote_counts[media_id] = 0
 
-        from core.elo import Rating
-
-        # Reset all ratings
-        self.cursor.execute("UPDATE media SET rating = 1200, votes = 0")
-        self.conn.commit()
+        self.cursor.execute("""
+            SELECT winner_id, loser_id 
+            FROM votes 
+            WHERE album_id = ?
+            ORDER BY timestamp ASC
+        """, (album_id,))
 
-        # Process votes per album
-        albums = self.get_albums()
-        for album in albums:
-            album_id = album[0]
-            media_count = self.get_total_media_count(album_id)
+        # Reliability only grows with the vote count, so once it reaches 85%
+        # the K-factor stays at 16 and no longer needs recomputing
+        k_factor = 32
+        for idx, (winner_id, loser_id) in enumerate(self.cursor.fetchall()):
+            if winner_id not in ratings or loser_id not in ratings:
+                continue
 
-            self.cursor.execute("""
-                        SELECT winner_id, loser_id 
-                        FROM votes 
-                        WHERE album_id = ?
-                        ORDER BY timestamp ASC
-                    """, (album_id,))
-            votes = self.cursor.fetchall()
-
-            ratings = {row[0]: 1200 for row in
-                       self.cursor.execute("SELECT id FROM media WHERE album_id = ?", (album_id,))}
-
-            # Process each vote with historical context
-            for idx, (winner_id, loser_id) in enumerate(votes):
-                if winner_id not in ratings or loser_id not in ratings:
-                    continue
-
-                v = idx + 1
+            if k_factor == 32:
                 reliability = ReliabilityCalculator.calculate_reliability(
-                    media_count, v, rating_system="elo"
+                    media_count, idx + 1, rating_system="elo"
                 )
-                k_factor = 32 if reliability < 85 else 16
-
-                rating = Rating(
-                    ratings[winner_id],
-                    ratings[loser_id],
-                    Rating.WIN,
-                    Rating.LOST,
-                    k_factor
-                )
-                new_ratings = rating.get_new_ratings()
-                ratings[winner_id] = new_ratings['a']
-                ratings[loser_id] = new_ratings['b']
-
-                self.cursor.execute("""
-                            UPDATE media 
-                            SET votes = votes + 1 
-                            WHERE id IN (?, ?)
-                        """, (winner_id, loser_id))
+                if reliability >= 85:
+                    k_factor = 16
 
-            # Update final ratings
-            for media_id, rating in ratings.items():
-                self.cursor.execute("""
-                            UPDATE media SET rating = ? WHERE id = ?
-                        """, (rating, media_id))
+            ratings[winner_id], ratings[loser_id] = elo_update(
+                ratings[winner_id], ratings[loser_id], k_factor
+            )
+            vote_counts[winner_id] += 1
+            vote_counts[loser_id] += 1
 
+        # Save final ratings and recomputed vote counts in one statement
+        self.cursor.executemany(
+            "UPDATE media SET rating = ?, votes = ? WHERE id = ?",
+            [(rating, vote_counts[media_id], media_id) for media_id, rating in ratings.items()]
+        )
         self.conn.commit()
 
     def _recalculate_glicko2(self, album_id: int):
@@ -471,119 +455,148 @@ class Database:
             album_id: Album containing the pair
             weight: Conviction strength (1 = normal vote, 2 = double vote).
                     Applies a stronger rating update but records a single vote edge.
+
+        Returns:
+            The album's rating system ("elo" or "glicko2")
         """
         weight = max(1, int(weight))
         try:
             self.conn.execute("BEGIN")
 
-            # Get rating system from album
-            rating_system = self.get_album_rating_system(album_id)
+            rating_system = self._apply_vote(winner_id, loser_id, album_id, weight)
+            self.conn.commit()
+            return rating_system
 
-            if rating_system == "elo":
-                # ELO SYSTEM ======================================================
-                # Get current ratings
-                self.cursor.execute("SELECT rating FROM media WHERE id = ?", (winner_id,))
-                winner_rating = self.cursor.fetchone()[0]
-                self.cursor.execute("SELECT rating FROM media WHERE id = ?", (loser_id,))
-                loser_rating = self.cursor.fetchone()[0]
-
-                # Calculate ELO updates
-                from core.elo import Rating
-                n = self.get_total_media_count(album_id)
-                v = self.get_total_votes(album_id)
-                mean_phi = None
-                reliability = ReliabilityCalculator.calculate_reliability(
-                    n, v + 1, rating_system=rating_system, mean_phi=mean_phi
-                )
-                k_factor = (32 if reliability < 85 else 16) * weight
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error updating ratings: {str(e)}")
+            raise e
 
-                elo = Rating(winner_rating, loser_rating,
-                             Rating.WIN, Rating.LOST, k_factor)
-                new_ratings = elo.get_new_ratings()
+    def update_ratings_batch(self, votes) -> list:
+        """
+        Apply several votes in order inside a single transaction.
 
-                # Update winner
-                self.cursor.execute("""
-                    UPDATE media 
-                    SET rating = ?, votes = votes + 1 
-                    WHERE id = ?
-                """, (new_ratings['a'], winner_id))
+        Args:
+            votes: Iterable of (winner_id, loser_id, album_id, weight) tuples
 
-                # Update loser
-                self.cursor.execute("""
-                    UPDATE media 
-                    SET rating = ?, votes = votes + 1 
-                    WHERE id = ?
-                """, (new_ratings['b'], loser_id))
+        Returns:
+            The rating system used for each vote, in order
+        """
+        try:
+            self.conn.execute("BEGIN")
+            rating_systems = [
+                self._apply_vote(winner_id, loser_id, album_id, max(1, int(weight)))
+                for winner_id, loser_id, album_id, weight in votes
+            ]
+            self.conn.commit()
+            return rating_systems
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error updating ratings batch: {str(e)}")
+            raise e
 
-            else:
-                # GLICKO2 SYSTEM ==================================================
-                from core.glicko2 import Glicko2Rating
+    def _apply_vote(self, winner_id: int, loser_id: int, album_id: int, weight: int) -> str:
+        """Update both ratings and record the vote edge (caller owns the transaction)."""
+        # Get rating system from album
+        rating_system = self.get_album_rating_system(album_id)
 
-                # Get current Glicko2 parameters for both items
-                self.cursor.execute("""
-                    SELECT rating, glicko_phi, glicko_sigma 
-                    FROM media 
-                    WHERE id IN (?, ?)
-                    ORDER BY CASE WHEN id = ? THEN 1 ELSE 2 END
-                """, (winner_id, loser_id, winner_id))
-
-                winner_mu, winner_phi, winner_sigma = self.cursor.fetchone()
-                loser_mu, loser_phi, loser_sigma = self.cursor.fetchone()
-
-                # Apply a stronger update for weight>1 without inserting rematch rows
-                new_a = {'mu': winner_mu, 'phi': winner_phi, 'sigma': winner_sigma}
-                new_b = {'mu': loser_mu, 'phi': loser_phi, 'sigma': loser_sigma}
-                for _ in range(weight):
-                    gr = Glicko2Rating(
-                        mu_a=new_a['mu'], phi_a=new_a['phi'], sigma_a=new_a['sigma'],
-                        mu_b=new_b['mu'], phi_b=new_b['phi'], sigma_b=new_b['sigma'],
-                        score_a=1.0, score_b=0.0
-                    )
-                    updated = gr.get_new_ratings()
-                    new_a, new_b = updated['a'], updated['b']
-
-                # Update winner
-                self.cursor.execute("""
-                    UPDATE media SET
-                        rating = ?,
-                        glicko_phi = ?,
-                        glicko_sigma = ?,
-                        votes = votes + 1
-                    WHERE id = ?
-                """, (
-                    new_a['mu'],
-                    new_a['phi'],
-                    new_a['sigma'],
-                    winner_id
-                ))
-
-                # Update loser
-                self.cursor.execute("""
-                    UPDATE media SET
-                        rating = ?,
-                        glicko_phi = ?,
-                        glicko_sigma = ?,
-                        votes = votes + 1
-                    WHERE id = ?
-                """, (
-                    new_b['mu'],
-                    new_b['phi'],
-                    new_b['sigma'],
-                    loser_id
-                ))
-
-            # Record a single vote edge (even for weighted/double votes)
+        if rating_system == "elo":
+            # ELO SYSTEM ======================================================
+            # Get current ratings
+            self.cursor.execute("SELECT rating FROM media WHERE id = ?", (winner_id,))
+            winner_rating = self.cursor.fetchone()[0]
+            self.cursor.execute("SELECT rating FROM media WHERE id = ?", (loser_id,))
+            loser_rating = self.cursor.fetchone()[0]
+
+            # Calculate ELO updates
+            n = self.get_total_media_count(album_id)
+            v = self.get_total_votes(album_id)
+            mean_phi = None
+            reliability = ReliabilityCalculator.calculate_reliability(
+                n, v + 1, rating_system=rating_system, mean_phi=mean_phi
+            )
+            k_factor = (32 if reliability < 85 else 16) * weight
+
+            new_winner_rating, new_loser_rating = elo_update(winner_rating, loser_rating, k_factor)
+
+            # Update winner
             self.cursor.execute("""
-                INSERT INTO votes (winner_id, loser_id, album_id)
-                VALUES (?, ?, ?)
-            """, (winner_id, loser_id, album_id))
+                UPDATE media 
+                SET rating = ?, votes = votes + 1 
+                WHERE id = ?
+            """, (new_winner_rating, winner_id))
 
-            self.conn.commit()
+            # Update loser
+            self.cursor.execute("""
+                UPDATE media 
+                SET rating = ?, votes = votes + 1 
+                WHERE id = ?
+            """, (new_loser_rating, loser_id))
 
-        except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error updating ratings: {str(e)}")
-            raise e
+        else:
+            # GLICKO2 SYSTEM ==================================================
+            from core.glicko2 import Glicko2Rating
+
+            # Get current Glicko2 parameters for both items
+            self.cursor.execute("""
+                SELECT rating, glicko_phi, glicko_sigma 
+                FROM media 
+                WHERE id IN (?, ?)
+                ORDER BY CASE WHEN id = ? THEN 1 ELSE 2 END
+            """, (winner_id, loser_id, winner_id))
+
+            winner_mu, winner_phi, winner_sigma = self.cursor.fetchone()
+            loser_mu, loser_phi, loser_sigma = self.cursor.fetchone()
+
+            # Apply a stronger update for weight>1 without inserting rematch rows
+            new_a = {'mu': winner_mu, 'phi': winner_phi, 'sigma': winner_sigma}
+            new_b = {'mu': loser_mu, 'phi': loser_phi, 'sigma': loser_sigma}
+            for _ in range(weight):
+                gr = Glicko2Rating(
+                    mu_a=new_a['mu'], phi_a=new_a['phi'], sigma_a=new_a['sigma'],
+                    mu_b=new_b['mu'], phi_b=new_b['phi'], sigma_b=new_b['sigma'],
+                    score_a=1.0, score_b=0.0
+                )
+                updated = gr.get_new_ratings()
+                new_a, new_b = updated['a'], updated['b']
+
+            # Update winner
+            self.cursor.execute("""
+                UPDATE media SET
+                    rating = ?,
+                    glicko_phi = ?,
+                    glicko_sigma = ?,
+                    votes = votes + 1
+                WHERE id = ?
+            """, (
+                new_a['mu'],
+                new_a['phi'],
+                new_a['sigma'],
+                winner_id
+            ))
+
+            # Update loser
+            self.cursor.execute("""
+                UPDATE media SET
+                    rating = ?,
+                    glicko_phi = ?,
+                    glicko_sigma = ?,
+                    votes = votes + 1
+                WHERE id = ?
+            """, (
+                new_b['mu'],
+                new_b['phi'],
+                new_b['sigma'],
+                loser_id
+            ))
+
+        # Record a single vote edge (even for weighted/double votes)
+        self.cursor.execute("""
+            INSERT INTO votes (winner_id, loser_id, album_id)
+            VALUES (?, ?, ?)
+        """, (winner_id, loser_id, album_id))
+
+        return rating_system
 
     def get_mean_glicko_phi(self, album_id: int) -> Optional[float]:
         """Average Glicko RD (phi) for an album, or None if empty."""
@@ -606,6 +619,14 @@ class Database:
         self.cursor.execute("SELECT COUNT(*) FROM media WHERE album_id = ?", (active_album_id,))
         return self.cursor.fetchone()[0]
 
+    def has_media_type(self, album_id: int, media_type: str) -> bool:
+        """Whether the album contains at least one item of media_type."""
+        self.cursor.execute(
+            "SELECT EXISTS(SELECT 1 FROM media WHERE album_id = ? AND type = ?)",
+            (album_id, media_type)
+        )
+        return bool(self.cursor.fetchone()[0])
+
     def get_media_type_counts(self, album_id: int) -> dict:
         """Get media type counts and total size for an album."""
         self.cursor.execute("""
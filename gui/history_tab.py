@@ -2,13 +2,11 @@
 import logging
 import os
 from PyQt6.QtCore import Qt, QTimer, QEvent
-from PyQt6.QtGui import QMovie
-from PyQt6.QtMultimedia import QMediaPlayer
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                              QTableWidgetItem, QHeaderView, QLineEdit,
                              QComboBox, QPushButton, QLabel, QAbstractItemView, QMessageBox, QCheckBox)
 from core.preview_handler import MediaPreview
-from core.media_handler import MediaHandler
+from core.media_handler import MediaHandler, MediaKind
 
 logger = logging.getLogger(__name__)
 
@@ -193,24 +191,23 @@ class HistoryTab(QWidget):
         media = self.media_handler.load_media(path)
         self.media_handler.pause_all_videos()
 
-        # Store references to the media player
-        media_player = None
-        widget = None
+        if media is None:
+            return
+
+        widget = media.widget
+        if media.kind == MediaKind.GIF:
+            self.preview.show_media(widget, media_path=path, gif_movie=media.player)
+            return
 
-        if isinstance(media, tuple):
-            widget, player = media
-            if hasattr(player, 'play'):  # Video player
-                media_player = player
-            elif isinstance(player, QMovie):  # GIF
-                media_player = player
+        media_player = media.player if media.kind == MediaKind.VIDEO else None
 
         # Install event filter for video controls
-        if widget and media_player:
+        if media_player:
             widget.installEventFilter(self)
             widget.setProperty('media_player', media_player)
             widget.setProperty('media_path', path)
 
-        self.preview.show_media(widget if widget else media,
+        self.preview.show_media(widget,
                                 media_path=path,
                                 video_player=media_player)
 
@@ -223,6 +220,7 @@ class HistoryTab(QWidget):
             if event.button() == Qt.MouseButton.LeftButton:
                 # Single click - toggle play/pause
                 if media_player:
+                    from PyQt6.QtMultimedia import QMediaPlayer
                     if media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
                         media_player.pause()
                     else:
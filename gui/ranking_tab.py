@@ -4,7 +4,7 @@ import os
 import time
 
 from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QMovie, QIcon, QKeyEvent
+from PyQt6.QtGui import QIcon, QKeyEvent
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton,
                              QLabel, QScrollArea, QGridLayout, QFrame, QMessageBox,
                              QComboBox, QWidget, QSizePolicy, QCheckBox, QLineEdit,
@@ -16,6 +16,7 @@ try:
 except ImportError:
     SEND2TRASH_AVAILABLE = False
 
+from core.media_handler import MediaKind
 from core.media_loader import ThreadedMediaLoader
 from core.media_utils import AspectRatioWidget
 from core.media_utils import set_file_info, handle_video_single_click, handle_video_events
@@ -405,18 +406,16 @@ class RankingTab(QWidget):
 
         media = self.media_handler.load_media_from_result(result)
 
-        if result.media_type == 'video':
-            if media:
-                frame.media_layout.addWidget(media)
-                self._wire_lazy_video(frame, media, result)
-        elif isinstance(media, tuple):  # GIF with a live QMovie
-            widget, movie = media
-            frame.media_layout.addWidget(widget)
-            frame.gif_movie = movie
-            widget.mousePressEvent = lambda e, p=path: self.show_preview(p)
-        elif isinstance(media, AspectRatioWidget):
-            frame.media_layout.addWidget(media)
-            media.mousePressEvent = lambda e, p=path: self.show_preview(p)
+        if media is None:
+            pass
+        elif media.kind == MediaKind.VIDEO:
+            frame.media_layout.addWidget(media.widget)
+            self._wire_lazy_video(frame, media.widget, result)
+        else:
+            frame.media_layout.addWidget(media.widget)
+            if media.kind == MediaKind.GIF:  # GIF with a live QMovie
+                frame.gif_movie = media.player
+            media.widget.mousePressEvent = lambda e, p=path: self.show_preview(p)
 
         # Set file info from the stats collected by the background loader
         if result.exists:
@@ -553,21 +552,23 @@ class RankingTab(QWidget):
         media = self.media_handler.load_media(media_path)
         self.media_handler.pause_all_videos()
 
-        if isinstance(media, AspectRatioWidget):
-            self.preview.show_media(media, enable_navigation=True, media_path=media_path)
-        elif isinstance(media, tuple) and media[0].__class__.__name__ == 'AspectRatioWidget':
-            if isinstance(media[1], QMovie):  # GIF
-                self.preview.show_media(media[0], gif_movie=media[1], enable_navigation=True, media_path=media_path)
-            else:  # Video
-                self.preview.show_media(
-                    media[0],
-                    video_player=media[1],
-                    enable_navigation=True,
-                    media_path=media_path,
-                    thumbnail_media_player=media_player
-                )
-                # Add event filter to video preview
-                media[0].installEventFilter(self.preview)
+        if media is None:
+            pass
+        elif media.kind == MediaKind.GIF:
+            self.preview.show_media(media.widget, gif_movie=media.player, enable_navigation=True,
+                                    media_path=media_path)
+        elif media.kind == MediaKind.VIDEO:
+            self.preview.show_media(
+                media.widget,
+                video_player=media.player,
+                enable_navigation=True,
+                media_path=media_path,
+                thumbnail_media_player=media_player
+            )
+            # Add event filter to video preview
+            media.widget.installEventFilter(self.preview)
+        else:
+            self.preview.show_media(media.widget, enable_navigation=True, media_path=media_path)
 
         # Set up navigation callbacks
         self.preview.set_navigation_callbacks(
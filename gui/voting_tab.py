@@ -1,10 +1,13 @@
-import time
+import logging
 import os
+from collections import deque
+from functools import partial
 
-from PyQt6.QtCore import Qt, QTimer, QObject
-from PyQt6.QtGui import QMovie, QKeyEvent
+from PyQt6.QtCore import Qt, QTimer, QObject, QEvent, pyqtSignal
+from PyQt6.QtGui import QKeyEvent, QPixmap, QImageReader
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QLabel, QFrame, QSizePolicy, QCheckBox, QMessageBox)
+                             QLabel, QFrame, QSizePolicy, QCheckBox, QMessageBox,
+                             QStackedWidget)
 
 try:
     import send2trash
@@ -12,14 +15,32 @@ try:
 except ImportError:
     SEND2TRASH_AVAILABLE = False
 
+from core.media_handler import ScalableLabel, MediaKind, LoadedMedia
+from core.media_loader import ThreadedMediaLoader
 from core.reliability_calculator import ReliabilityCalculator
-from core.media_utils import set_file_info, handle_video_single_click, handle_video_events
+from core.media_utils import (set_file_info, handle_video_single_click, handle_video_events,
+                              AspectRatioWidget)
 from core.preview_handler import MediaPreview
-from core.media_utils import AspectRatioWidget
-from core.video_player import VideoPlayer
+
+logger = logging.getLogger(__name__)
+
+# Longest edge voting media is decoded to. Frames never get larger than half
+# a 4K screen, so decoding beyond this only costs time and memory.
+PAIR_DECODE_MAX_SIZE = 1920
+# Pair decodes target the frame size in device pixels, rounded up to this
+# step so small resizes keep hitting the decoded image cache
+PAIR_DECODE_STEP = 256
+
+# Vote buttons while a vote is being processed. Set once per button; the
+# cooldown property then switches it on and off without re-parsing QSS.
+COOLDOWN_BUTTON_STYLE = 'QPushButton[cooldown="true"] { background-color: grey; color: white; }'
+# Winner highlight, switched by the frame's flash property in the same way
+FLASH_FRAME_STYLE = 'MediaFrame[flash="true"] { background-color: rgba(255, 255, 255, 30); }'
 
 
 class MediaFrame(QFrame):
+    flash_done = pyqtSignal()  # The winner flash has been shown and reverted
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
@@ -33,6 +54,24 @@ class MediaFrame(QFrame):
         self.media_player = None
         self.gif_movie = None  # GIF animation movie player
 
+        # One page per kind of content. The placeholder and image pages live
+        # as long as the frame; a new image only swaps the label's pixmap.
+        # GIF and video widgets are added as pages while they are displayed.
+        self.stack = QStackedWidget()
+        self.stack.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.stack.hide()
+        self.layout.addWidget(self.stack)
+
+        # Shown while the frame has no media yet
+        self.placeholder_label = QLabel("Loading…")
+        self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.placeholder_label.setStyleSheet("color: #AAAAAA;")
+        self.stack.addWidget(self.placeholder_label)
+
+        self.image_label = ScalableLabel()
+        self.image_page = AspectRatioWidget(self.image_label)
+        self.stack.addWidget(self.image_page)
+
         # File info label
         self.file_info_label = QLabel()
         self.file_info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -48,12 +87,14 @@ class MediaFrame(QFrame):
         # Regular Vote button
         self.vote_button = QPushButton("Vote")
         self.vote_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Disable focus
+        self.vote_button.setStyleSheet(COOLDOWN_BUTTON_STYLE)
         self.button_layout.addWidget(self.vote_button)
 
         # Double Vote button
         self.double_vote_button = QPushButton("Double Vote")
         self.double_vote_button.setFixedWidth(80)  # Smaller width
         self.double_vote_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)  # Disable focus
+        self.double_vote_button.setStyleSheet(COOLDOWN_BUTTON_STYLE)
         self.button_layout.addWidget(self.double_vote_button)
 
         # Delete button
@@ -69,97 +110,225 @@ class MediaFrame(QFrame):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setMinimumSize(400, 400)  # Set a minimum size for the media container
 
-        self.default_style = self.styleSheet()
+        self.setStyleSheet(FLASH_FRAME_STYLE)
+        self._cooldown_styled = False
 
-    def set_file_info(self, file_path):
-        set_file_info(file_path, self.file_info_label)
+    def set_file_info(self, file_path, file_size=None, modified_time=None):
+        set_file_info(file_path, self.file_info_label,
+                      file_size=file_size, modified_time=modified_time)
+
+    def show_page(self, widget):
+        """Display widget in the media area, adding it as a page if needed."""
+        if self.stack.indexOf(widget) < 0:
+            self.stack.addWidget(widget)
+        self.stack.setCurrentWidget(widget)
+        self.stack.show()
+
+    def show_image(self, pixmap):
+        """Paint pixmap into the persistent image page and display it."""
+        self.image_label.reset_source()
+        self.image_label.setPixmap(pixmap)
+        self.image_page.set_aspect_ratio(self.image_label.get_aspect_ratio())
+        self.show_page(self.image_page)
+        return self.image_page
 
     def set_cooldown_style(self, on_cooldown):
-        """Set the button style when on cooldown."""
+        """Set the button style when on cooldown; vote buttons are disabled meanwhile."""
+        self.vote_button.setEnabled(not on_cooldown)
+        self.double_vote_button.setEnabled(not on_cooldown)
+        # Re-polishing restyles the button even if nothing changed
+        if on_cooldown == self._cooldown_styled:
+            return
+        self._cooldown_styled = on_cooldown
+        for button in (self.vote_button, self.double_vote_button):
+            button.setProperty("cooldown", on_cooldown)
+            # Property selectors are only re-evaluated on polish
+            button.style().unpolish(button)
+            button.style().polish(button)
         if on_cooldown:
-            self.vote_button.setStyleSheet("background-color: grey; color: white;")
             self.vote_button.setText("Cooldown...")
-            self.double_vote_button.setStyleSheet("background-color: grey; color: white;")
             self.double_vote_button.setText("Cooldown...")
         else:
-            self.vote_button.setStyleSheet("")
             self.vote_button.setText("Vote")
-            self.double_vote_button.setStyleSheet("")
             self.double_vote_button.setText("Double Vote")
 
     def flash_winner(self):
         """Create a subtle flash effect for winning media"""
-        self.setStyleSheet("QFrame { background-color: rgba(255, 255, 255, 30); }")
+        self._set_flash(True)
         QTimer.singleShot(150, self.reset_style)
 
     def reset_style(self):
         """Reset frame style after flash"""
-        self.setStyleSheet(self.default_style)
+        self._set_flash(False)
+        self.flash_done.emit()
+
+    def _set_flash(self, on):
+        self.setProperty("flash", on)
+        # Only the frame itself matches the rule, so only it is re-polished
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
 
 
 class PreloadPair(QObject):
+    """
+    A voting pair whose media is decoded in background threads.
+
+    load_pair() returns immediately; loaded is emitted on the main thread once
+    both sides are decoded and their widgets are built.
+    """
+    loaded = pyqtSignal()
+
     def __init__(self, media_handler):
         super().__init__()
         self.media_handler = media_handler
+        self.album_id = None  # Album the pair was selected from
         self.left_data = None  # (id, path, rating, votes)
         self.right_data = None
         self.left_media = None  # Loaded media widget
         self.right_media = None
+        self.left_stat = None  # (file_size, modified_time) read by the loader
+        self.right_stat = None
         self.is_loaded = False
+        self.is_loading = False
+        self._results = {}  # side index -> MediaLoadResult
 
-    def load_pair(self, left_data, right_data):
-        """Load media pair in memory with error handling"""
+        self.loader = ThreadedMediaLoader(max_size=PAIR_DECODE_MAX_SIZE)
+        self.loader.media_loaded.connect(self._on_media_loaded)
+        self.loader.all_media_loaded.connect(self._on_all_media_loaded)
+
+    def load_pair(self, left_data, right_data, album_id, max_size=None):
+        """
+        Start decoding a media pair off the main thread
+
+        Args:
+            album_id: Album the pair was selected from
+            max_size: Longest edge to decode to; keeps the previous bound if None
+        """
+        # A preloaded pair may be replaced before it was ever shown (skip,
+        # album switch); release it instead of dropping the references
+        self._release_media()
+        self.album_id = album_id
+        self.left_data = left_data
+        self.right_data = right_data
+        self.is_loaded = False
+        self._results = {}
+        if max_size is not None:
+            self.loader.max_size = max_size
+        if left_data and right_data:
+            self.is_loading = True
+            self.loader.load_media_batch([left_data, right_data])
+        else:
+            self.is_loading = False
+            self.loader.stop()
+
+    def _on_media_loaded(self, result):
+        """Collect a decoded side (main thread)"""
+        if result.generation != self.loader.generation:
+            return  # Stale result from a replaced pair
+        self._results[result.index] = result
+
+    def _on_all_media_loaded(self, generation):
+        """Build widgets for both decoded sides and announce the pair"""
+        if generation != self.loader.generation:
+            return
+        self.left_stat = self._stat_of(self._results.get(0))
+        self.right_stat = self._stat_of(self._results.get(1))
         try:
-            self.left_data = left_data
-            self.right_data = right_data
-            if left_data and right_data:
-                self.left_media = self.media_handler.load_media(left_data[1]) or None
-                self.right_media = self.media_handler.load_media(right_data[1]) or None
-                self.is_loaded = bool(self.left_media and self.right_media)
-            else:
-                self.is_loaded = False
+            self.left_media = self._build_media(self._results.get(0))
+            self.right_media = self._build_media(self._results.get(1))
+            self.is_loaded = bool(self.left_media and self.right_media)
         except Exception as e:
+            logger.error(f"Error building voting media: {e}")
             self.is_loaded = False
+        self._results = {}
+        self.is_loading = False
+        self.loaded.emit()
+
+    @staticmethod
+    def _stat_of(result):
+        if result is None or not result.exists:
+            return None
+        return result.file_size, result.modified_time
+
+    def _build_media(self, result):
+        if result is None:
+            return None
+        if (result.media_type == 'image' and result.thumbnail is not None
+                and not result.thumbnail.isNull()):
+            # Painted into the frame's persistent image page; no widget needed
+            return QPixmap.fromImage(result.thumbnail)
+        return self.media_handler.load_media_from_result(result, create_player=True) or None
+
+    def take_media(self):
+        """Hand the built widgets over to the caller, which now owns them"""
+        media = self.left_media, self.right_media
+        self.left_media = None
+        self.right_media = None
+        return media
 
-    def cleanup(self):
-        """Clean up loaded media"""
+    def _release_media(self):
+        """Free widgets and players that were built but never displayed"""
         for media in [self.left_media, self.right_media]:
-            if isinstance(media, tuple):
-                if media[1].__class__.__name__ == 'QMediaPlayer':
-                    media[1].stop()
-                elif media[1].__class__.__name__ == 'QMovie':
-                    media[1].stop()
-                media[0].deleteLater()
-            elif media:
-                media.deleteLater()
+            if not isinstance(media, LoadedMedia):
+                continue  # Nothing, or a bare pixmap for the frame's image page
+            if media.kind == MediaKind.GIF:
+                # GIF movies have no Qt parent; hand them back for reuse
+                self.media_handler.release_gif_movie(media.player)
+            elif media.player:
+                # Unloads the video now and keeps the VideoPlayer for reuse
+                video_player = media.widget.layout().itemAt(0).widget()
+                self.media_handler.release_video_player(video_player)
+            media.widget.deleteLater()
         self.left_media = None
         self.right_media = None
+
+    def cleanup(self):
+        """Clean up loaded media"""
+        self.loader.stop()
+        self._release_media()
         self.is_loaded = False
+        self.is_loading = False
 
 
 class VotingTab(QWidget):
-    def __init__(self, get_pair_callback, update_ratings_callback, media_handler,
+    def __init__(self, request_pair_callback, update_ratings_callback, media_handler,
                  ranking_tab, get_total_media_count, get_total_votes,
-                 get_album_rating_system=None, get_mean_glicko_phi=None):
+                 get_album_rating_system=None, get_mean_glicko_phi=None,
+                 has_media_type=None, request_album_stats=None):
+        """
+        Args:
+            request_pair_callback: request_pair_callback(request_id, album_id)
+                queues a pair selection off the GUI thread; the answer must be
+                delivered to on_pair_fetched()
+            request_album_stats: Optional request_album_stats(album_id) that
+                reads the album's counts off the GUI thread and delivers them to
+                on_album_stats_fetched(). Without it the getters are called
+                directly.
+        """
         super().__init__()
-        self.get_pair_callback = get_pair_callback
+        self.request_pair_callback = request_pair_callback
         self.update_ratings_callback = update_ratings_callback
         self.media_handler = media_handler
         self.ranking_tab = ranking_tab  # Store reference to RankingTab
-        self.preview = MediaPreview(self)
+        self.preview = None  # MediaPreview, created on first use and reused
         self.get_album_rating_system = get_album_rating_system
         self.get_mean_glicko_phi = get_mean_glicko_phi
+        self.has_media_type = has_media_type
+        self.request_album_stats = request_album_stats
+        # Votes cast so far, and the count at each outstanding stats request:
+        # votes queued after a request are missing from its answer
+        self._votes_cast = 0
+        self._stats_vote_marks = deque()
+        self.album_has_videos = False
+        self._image_formats_warmed = False
 
         self.current_left = None
         self.current_right = None
         self.images_loaded = False
-        self.last_vote_time = 0
-        # Cooldown ends when the next pair is ready, capped at this duration
-        self.vote_cooldown = 0.3
-        self.cooldown_timer = QTimer(self)
-        self.cooldown_timer.setSingleShot(True)
-        self.cooldown_timer.timeout.connect(self.end_cooldown)
         self.active_album_id = 1  # Default album
+        # Set by a vote and cleared once the next pair is on screen, so a
+        # pair can be voted on only once and voting runs as fast as pairs load
         self._on_cooldown = False
 
         self.reliability_label = QLabel()
@@ -169,25 +338,58 @@ class VotingTab(QWidget):
         self.get_total_votes = get_total_votes
         self.total_media = 0
         self.total_votes = 0
+        self._vote_error_shown = False  # status_label reports a failed vote write
         self.rating_system = "glicko2"
         self.mean_phi = None
+        self._reliability_inputs = None  # Inputs behind the shown reliability labels
+
+        # Arrow keys vote; looked up once per key press
+        self._key_votes = {
+            Qt.Key.Key_Left.value: self._vote_left,
+            Qt.Key.Key_Right.value: self._vote_right,
+        }
 
         self.single_click_timer = QTimer(self)
         self.single_click_timer.setSingleShot(True)
-        self.single_click_timer.timeout.connect(lambda: handle_video_single_click(self.pending_video_click))
-        self.pending_video_click = []
+        self.pending_video_click = []  # Mutated in place by the shared video helpers
+        self.single_click_timer.timeout.connect(
+            partial(handle_video_single_click, self.pending_video_click))
 
         self.current_pair = PreloadPair(media_handler)
         self.next_pair = PreloadPair(media_handler)
-        self.preload_timer = QTimer(self)
-        self.preload_timer.setSingleShot(True)
-        self.preload_timer.timeout.connect(self._finish_preload)
-
-        # Delayed preload timer
+        # Pairs swap roles after each vote, so dispatch on the emitting pair
+        for pair in (self.current_pair, self.next_pair):
+            pair.loaded.connect(partial(self._on_pair_loaded, pair))
+        self._swap_pending = False  # Vote cast while next pair was still decoding
+
+        # Outstanding pair selections: role ('current' or 'next') -> request id.
+        # Answers to replaced or cancelled requests are ignored.
+        self._pair_requests = {}
+        self._last_pair_request_id = 0
+
+        # Preload of the next pair starts on the next event loop pass, right
+        # after the current pair has been painted. Decoding runs in the pair's
+        # loader threads, so there is no reason to wait any longer.
         self.delayed_preload_timer = QTimer(self)
         self.delayed_preload_timer.setSingleShot(True)
+        self.delayed_preload_timer.setInterval(0)
         self.delayed_preload_timer.timeout.connect(self._start_preload)
 
+        # Pair loads requested by album switches / tab changes run on the next
+        # event loop pass, so the tab paints before any DB or disk work starts.
+        # Repeated requests within one pass collapse into a single load.
+        self.pair_load_timer = QTimer(self)
+        self.pair_load_timer.setSingleShot(True)
+        self.pair_load_timer.setInterval(0)
+        self.pair_load_timer.timeout.connect(self.load_new_pair)
+
+        # Reliability labels after a vote are refreshed once the click has been
+        # handled; a vote and its acknowledgement collapse into one update
+        self.reliability_update_timer = QTimer(self)
+        self.reliability_update_timer.setSingleShot(True)
+        self.reliability_update_timer.setInterval(0)
+        self.reliability_update_timer.timeout.connect(self.update_reliability_info)
+
         self.history_tab = None
 
         self.autoplay_videos_checkbox = None
@@ -235,24 +437,27 @@ class VotingTab(QWidget):
 
         # Left media frame
         self.left_frame = MediaFrame()
-        self.left_frame.vote_button.clicked.connect(
-            lambda: self.handle_vote("left", 1))
-        self.left_frame.double_vote_button.clicked.connect(
-            lambda: self.handle_vote("left", 2))
-        self.left_frame.delete_button.clicked.connect(
-            lambda: self.handle_delete("left"))
+        self.left_frame.vote_button.clicked.connect(self._vote_left)
+        self.left_frame.double_vote_button.clicked.connect(self._double_vote_left)
+        self.left_frame.delete_button.clicked.connect(partial(self.handle_delete, "left"))
         media_layout.addWidget(self.left_frame, 1)  # Equal stretch for both frames
 
         # Right media frame
         self.right_frame = MediaFrame()
-        self.right_frame.vote_button.clicked.connect(
-            lambda: self.handle_vote("right", 1))
-        self.right_frame.double_vote_button.clicked.connect(
-            lambda: self.handle_vote("right", 2))
-        self.right_frame.delete_button.clicked.connect(
-            lambda: self.handle_delete("right"))
+        self.right_frame.vote_button.clicked.connect(self._vote_right)
+        self.right_frame.double_vote_button.clicked.connect(self._double_vote_right)
+        self.right_frame.delete_button.clicked.connect(partial(self.handle_delete, "right"))
         media_layout.addWidget(self.right_frame, 1)  # Equal stretch for both frames
 
+        self._frames_by_stack = {}
+        for frame in (self.left_frame, self.right_frame):
+            # Clicks on any page of a frame bubble up to its stack; one filter
+            # opens the preview for whatever the frame is showing
+            self._frames_by_stack[frame.stack] = frame
+            frame.stack.installEventFilter(self)
+            # The winner's flash ending moves voting on to the next pair
+            frame.flash_done.connect(self._replace_current_pair)
+
         layout.addLayout(media_layout)
 
         # Skip button
@@ -286,9 +491,13 @@ class VotingTab(QWidget):
         """Toggle autoloop videos state and apply to current videos."""
         self.autoloop_videos = state == Qt.CheckState.Checked.value
         for frame_widget in [self.left_frame, self.right_frame]:
-            # frame_widget.media_widget is AspectRatioWidget if media is loaded
-            if frame_widget.media_widget and hasattr(frame_widget.media_widget, 'layout') and frame_widget.media_widget.layout().count() > 0:
-                inner_widget = frame_widget.media_widget.layout().itemAt(0).widget()
+            if frame_widget.media_player is None:
+                continue  # Not showing a video
+            from core.video_player import VideoPlayer
+            # frame_widget.media_widget is the AspectRatioWidget around the player
+            layout = frame_widget.media_widget.layout()
+            if layout is not None and layout.count() > 0:
+                inner_widget = layout.itemAt(0).widget()
                 if isinstance(inner_widget, VideoPlayer):
                     inner_widget.setLooping(self.autoloop_videos)
 
@@ -297,7 +506,21 @@ class VotingTab(QWidget):
         self.history_tab = history_tab
 
     def eventFilter(self, obj, event):
-        """Handle video widget events using shared utility."""
+        """Open previews on frame clicks; video widgets use the shared utility."""
+        event_type = event.type()
+        # Paint, move and hover events make up most of the traffic; only
+        # presses and double clicks are of interest
+        if (event_type != QEvent.Type.MouseButtonPress
+                and event_type != QEvent.Type.MouseButtonDblClick):
+            return False
+        frame = self._frames_by_stack.get(obj)
+        if frame is not None:
+            if event_type != QEvent.Type.MouseButtonPress:
+                return False
+            if (frame.media_widget is not None
+                    and frame.stack.currentWidget() is frame.media_widget):
+                self.show_preview(frame.media_widget.property('media_path'))
+            return True
         handled = handle_video_events(
             event, obj,
             self.single_click_timer,
@@ -310,10 +533,13 @@ class VotingTab(QWidget):
 
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard voting using arrow keys."""
-        if event.key() == Qt.Key.Key_Left:
-            self.handle_vote("left", 1)  # Regular vote for left image
-        elif event.key() == Qt.Key.Key_Right:
-            self.handle_vote("right", 1)  # Regular vote for right image
+        # A held key must not keep voting, and keys pressed during the
+        # cooldown are dropped before any lookup
+        if event.isAutoRepeat() or self._on_cooldown:
+            return
+        vote = self._key_votes.get(event.key())
+        if vote is not None:
+            vote()  # Regular vote for the matching side
 
     def load_new_pair(self):
         """Load initial pairs"""
@@ -322,11 +548,39 @@ class VotingTab(QWidget):
             self.disable_voting()
             return
 
-        # Retrieve first media pair
-        media_pair = self.get_pair_callback(self.active_album_id)
+        # Pair selection runs on the database thread; see _show_new_pair
+        self._request_pair('current')
+
+    def _request_pair(self, role):
+        """Ask for a pair for role, replacing any outstanding request for it"""
+        self._last_pair_request_id += 1
+        self._pair_requests[role] = self._last_pair_request_id
+        self.request_pair_callback(self._last_pair_request_id, self.active_album_id)
+
+    def on_pair_fetched(self, request_id: int, album_id: int, media_pair):
+        """Receive a pair selected on the database thread"""
+        for role, pending_id in self._pair_requests.items():
+            if pending_id == request_id:
+                break
+        else:
+            return  # Replaced or cancelled request
+        del self._pair_requests[role]
+        if album_id != self.active_album_id:
+            return
+        if role == 'current':
+            self._show_new_pair(media_pair)
+        else:
+            self._preload_pair(media_pair)
+
+    def _show_new_pair(self, media_pair):
+        """Start displaying a freshly selected pair, or the empty album state"""
         if not media_pair or None in media_pair:
             self._clear_frames()
+            self.left_frame.stack.hide()
+            self.right_frame.stack.hide()
             self.status_label.setText("No media items in this album")
+            # End the cooldown first: it would re-enable the vote buttons
+            self.end_cooldown()
             self.disable_voting()
             self.left_frame.button_container.hide()
             self.right_frame.button_container.hide()
@@ -347,24 +601,60 @@ class VotingTab(QWidget):
         self.right_frame.file_info_label.show()
 
 
-        # Load and display current media pair
-        self.current_pair.load_pair(*media_pair)
-        self._display_current_pair()
+        # Frames showing nothing yet get the loading placeholder; frames with
+        # media keep it on screen until the new pair replaces it
+        for frame in (self.left_frame, self.right_frame):
+            if frame.media_widget is None:
+                frame.show_page(frame.placeholder_label)
+
+        # Decode the pair in the background; it is displayed once loaded
+        self.current_pair.load_pair(*media_pair, self.active_album_id,
+                                    max_size=self._pair_decode_size())
 
-        # Schedule preloading next pair with delay
-        self.delayed_preload_timer.start(100)
+    def _on_pair_loaded(self, pair):
+        """Route a finished background load to the pair's current role"""
+        if pair is self.current_pair:
+            self._display_current_pair()
+            # Ends a cooldown left over from a discarded pair (album switch,
+            # deletion)
+            self.end_cooldown()
+            self.delayed_preload_timer.start()
+            QTimer.singleShot(0, self._idle_preload)
+        elif pair is self.next_pair:
+            self._finish_preload()
+            if self._swap_pending:
+                self._swap_pending = False
+                self._replace_current_pair()
+
+    def _idle_preload(self):
+        """Warm up one-time costs while the user looks at the first pair"""
+        if not self._image_formats_warmed:
+            # Loads and caches the image format plugins
+            QImageReader.supportedImageFormats()
+            self._image_formats_warmed = True
+        if self.album_has_videos:
+            self.media_handler.prewarm_video_player()
 
     def _start_preload(self):
         """Start preloading next pair in the background"""
-        media_pair = self.get_pair_callback(self.active_album_id)
-        if media_pair and None not in media_pair:
-            # Use a new timer to enable voting once preload is complete
-            QTimer.singleShot(0, lambda: self._do_preload(media_pair))
+        self._request_pair('next')
 
-    def _do_preload(self, media_pair):
-        """ Perform media preloading"""
-        self.next_pair.load_pair(*media_pair)
-        self.enable_voting()
+    def _preload_pair(self, media_pair):
+        """Decode the selected next pair in the background"""
+        if media_pair and None not in media_pair:
+            self.next_pair.load_pair(*media_pair, self.active_album_id,
+                                     max_size=self._pair_decode_size())
+        elif self._swap_pending:
+            # Nothing to swap in; let _replace_current_pair recover
+            self._swap_pending = False
+            self._replace_current_pair()
+
+    def _pair_decode_size(self):
+        """Longest edge a frame can show in device pixels, bounded by PAIR_DECODE_MAX_SIZE"""
+        frame = self.left_frame
+        longest = max(frame.width(), frame.height()) * frame.devicePixelRatioF()
+        steps = -(-int(longest) // PAIR_DECODE_STEP)  # Round up
+        return max(PAIR_DECODE_STEP, min(PAIR_DECODE_MAX_SIZE, steps * PAIR_DECODE_STEP))
 
     def _display_current_pair(self):
         """Display current pair in frames"""
@@ -374,71 +664,80 @@ class VotingTab(QWidget):
         # Clear existing media from frames
         self._clear_frames()
 
-        def setup_frame(frame, media, path):
+        def setup_frame(frame, media, path, stat):
             """Helper function to set up a single frame with its media"""
             if not media:
+                frame.stack.hide()
                 frame.file_info_label.setText(f"Failed to load: {path}")
                 frame.media_widget = None
                 return
 
-            if isinstance(media, tuple):
-                frame.media_widget = media[0]
-
-                if isinstance(media[1], QMovie):  # GIF
-                    frame.gif_movie = media[1]
-                    frame.layout.insertWidget(0, media[0])
-                    media[0].mousePressEvent = lambda e, p=path: self.show_preview(p)
-                else:  # Video
-                    frame.media_player = media[1]
-                    frame.layout.insertWidget(0, media[0])
-
-                    # Set video-specific properties
-                    frame.media_widget.setProperty('is_video', True)
-                    frame.media_widget.setProperty('media_player', frame.media_player)
-                    frame.media_widget.setProperty('media_path', path)
-                    frame.media_widget.installEventFilter(self)
-
-                    # Get the VideoPlayer instance from AspectRatioWidget (media[0])
-                    # media[0] is AspectRatioWidget, its child is VideoPlayer
-                    actual_video_player_widget = media[0].layout().itemAt(0).widget()
-                    if isinstance(actual_video_player_widget, VideoPlayer):
-                        actual_video_player_widget.setLooping(self.autoloop_videos)
-                        
-                        if self.autoplay_videos:
-                            # Use request_autoplay() which waits for media to be ready before playing
-                            # This prevents audio from playing while video rendering isn't ready
-                            actual_video_player_widget.request_autoplay()
+            if isinstance(media, QPixmap):
+                frame.media_widget = frame.show_image(media)
+            elif media.kind == MediaKind.GIF:
+                frame.media_widget = media.widget
+                frame.gif_movie = media.player
+            elif media.kind == MediaKind.VIDEO:
+                frame.media_widget = media.widget
+                frame.media_player = media.player
+
+                # Set video-specific properties
+                frame.media_widget.setProperty('is_video', True)
+                frame.media_widget.setProperty('media_player', frame.media_player)
+                frame.media_widget.installEventFilter(self)
+
+                # media.widget is the AspectRatioWidget around the VideoPlayer
+                video_player = media.widget.layout().itemAt(0).widget()
+                video_player.setLooping(self.autoloop_videos)
+                if self.autoplay_videos:
+                    # Use request_autoplay() which waits for media to be ready before playing
+                    # This prevents audio from playing while video rendering isn't ready
+                    video_player.request_autoplay()
             else:
-                frame.media_widget = media
+                frame.media_widget = media.widget
 
             if frame.media_widget:
-                frame.layout.insertWidget(0, frame.media_widget)
-                frame.media_widget.mousePressEvent = lambda e, p=path: self.show_preview(p)
+                frame.media_widget.setProperty('media_path', path)
+                frame.show_page(frame.media_widget)
             else:
+                frame.stack.hide()
                 frame.file_info_label.setText(f"Failed to load: {path}")
 
-            frame.set_file_info(path)
+            # Reuse the loader's stat; only a missing result touches the disk
+            if stat:
+                frame.set_file_info(path, *stat)
+            else:
+                frame.set_file_info(path)
+
+        # The frames own the widgets from here on; _clear_frames releases them
+        left_media, right_media = self.current_pair.take_media()
 
         # Set up left frame
         left_path = self.current_pair.left_data[1] if self.current_pair.left_data else ""
-        setup_frame(self.left_frame, self.current_pair.left_media, left_path)
+        setup_frame(self.left_frame, left_media, left_path, self.current_pair.left_stat)
 
         # Set up right frame
         right_path = self.current_pair.right_data[1] if self.current_pair.right_data else ""
-        setup_frame(self.right_frame, self.current_pair.right_media, right_path)
+        setup_frame(self.right_frame, right_media, right_path, self.current_pair.right_stat)
 
         self.images_loaded = True
 
     def _clear_frames(self):
         """Clear media from frames"""
         for frame in [self.left_frame, self.right_frame]:
-            if frame.media_widget:
+            if frame.media_widget is frame.image_page:
+                # Persistent page: drop the pixmap, keep the widgets
+                frame.image_label.reset_source()
+                frame.image_label.clear()
+                frame.media_widget = None
+            elif frame.media_widget:
+                frame.stack.removeWidget(frame.media_widget)
                 if frame.media_player:
-                    frame.media_player.stop()
-                    frame.media_player.deleteLater()
+                    # Hand the VideoPlayer back for reuse by a later video
+                    video_player = frame.media_widget.layout().itemAt(0).widget()
+                    self.media_handler.release_video_player(video_player)
                 if frame.gif_movie:
-                    frame.gif_movie.stop()
-                    frame.gif_movie.deleteLater()
+                    self.media_handler.release_gif_movie(frame.gif_movie)
                 frame.media_widget.deleteLater()
                 frame.media_widget = None
                 frame.media_player = None
@@ -447,11 +746,29 @@ class VotingTab(QWidget):
     def set_active_album(self, album_id: int):
         """Set the active album and reload media pair."""
         self.active_album_id = album_id
+        # Nothing from the previous album may be voted on or swapped in while
+        # the new album's first pair is selected and decoded
+        self._discard_pairs()
         self._refresh_counts()
-        self.load_new_pair()
+        self.pair_load_timer.start()
+
+    def _discard_pairs(self):
+        """Drop the shown and the preloaded pair; voting resumes once a new pair is shown"""
+        self.delayed_preload_timer.stop()
+        self._swap_pending = False
+        self._pair_requests.clear()
+        self._clear_frames()
+        self.current_pair.cleanup()
+        self.next_pair.cleanup()
+        self.disable_voting()
 
     def _refresh_counts(self):
         """Refresh media and vote counts from database"""
+        if self.request_album_stats:
+            self._stats_vote_marks.append(self._votes_cast)
+            self.request_album_stats(self.active_album_id)
+            return
+
         self.total_media = self.get_total_media_count(self.active_album_id)
         self.total_votes = self.get_total_votes(self.active_album_id)
         if self.get_album_rating_system:
@@ -462,10 +779,30 @@ class VotingTab(QWidget):
             self.mean_phi = self.get_mean_glicko_phi(self.active_album_id)
         else:
             self.mean_phi = None
+        if self.has_media_type:
+            self.album_has_videos = self.has_media_type(self.active_album_id, 'video')
+        self.update_reliability_info()
+
+    def on_album_stats_fetched(self, album_id: int, stats):
+        """Receive album counts read on the database thread (None on error)"""
+        votes_at_request = self._stats_vote_marks.popleft() if self._stats_vote_marks else self._votes_cast
+        if album_id != self.active_album_id or stats is None:
+            return
+        self.total_media = stats['total_media']
+        self.total_votes = stats['total_votes'] + self._votes_cast - votes_at_request
+        self.rating_system = stats['rating_system']
+        self.mean_phi = stats['mean_phi']
+        self.album_has_videos = stats['has_videos']
         self.update_reliability_info()
 
     def update_reliability_info(self):
         """Update reliability information using cached values"""
+        # Album switches and count refreshes often leave every input unchanged
+        inputs = (self.total_media, self.total_votes, self.rating_system, self.mean_phi)
+        if inputs == self._reliability_inputs:
+            return
+        self._reliability_inputs = inputs
+
         if self.total_media == 0:
             current_reliability = 0.0
             target = None
@@ -509,61 +846,148 @@ class VotingTab(QWidget):
         """Force refresh media count from database"""
         self._refresh_counts()
 
+    def _displayed_pixmap(self, media_path):
+        """
+        Pixmap a frame already decoded for media_path, if it is good enough
+        for the full-window preview; None otherwise.
+        """
+        for frame in (self.left_frame, self.right_frame):
+            if frame.media_widget is None or frame.media_player or frame.gif_movie:
+                continue
+            if frame.media_widget.property('media_path') != media_path:
+                continue
+            label = frame.media_widget.layout().itemAt(0).widget()
+            if not isinstance(label, ScalableLabel) or label.source_pixmap() is None:
+                return None
+            pixmap = label.source_pixmap()
+            longest = max(pixmap.width(), pixmap.height())
+            limit = ScalableLabel.screen_pixel_limit()
+            # Pair decodes stop at the pair's decode bound: anything smaller is
+            # the full image, anything at least screen-sized loses nothing on screen
+            decode_size = self.current_pair.loader.max_size
+            if longest < decode_size or (limit is not None and longest >= limit):
+                return pixmap
+            return None
+        return None
+
     def show_preview(self, media_path, media_player=None):
         """Show media preview overlay"""
-        media = self.media_handler.load_media(media_path)
+        if (self.preview is not None and self.preview.isVisible()
+                and self.preview.current_media_path == media_path):
+            # Already showing this item; building it again would only
+            # restart its decode or video pipeline
+            self.preview.raise_()
+            return
+        pixmap = self._displayed_pixmap(media_path)
+        if pixmap is not None:
+            # Reuse the frame's decode instead of reading the file again
+            label = ScalableLabel()
+            label.setPixmap(pixmap)
+            media = LoadedMedia(MediaKind.IMAGE, AspectRatioWidget(label, label.get_aspect_ratio()))
+        else:
+            media = self.media_handler.load_media(media_path)
         self.media_handler.pause_all_videos()
-        if isinstance(media, AspectRatioWidget):
-            self.preview.show_media(media, media_path=media_path)
-        elif isinstance(media, tuple) and media[0].__class__.__name__ == 'AspectRatioWidget':
-            if isinstance(media[1], QMovie):  # GIF
-                self.preview.show_media(media[0], gif_movie=media[1], media_path=media_path)
-            else:  # Video
-                self.preview.show_media(media[0], video_player=media[1], media_path=media_path,
-                                        thumbnail_media_player=media_player)
+        if media is None:
+            return
+        if self.preview is None:
+            self.preview = MediaPreview(self)
+        if media.kind == MediaKind.GIF:
+            self.preview.show_media(media.widget, gif_movie=media.player, media_path=media_path)
+        elif media.kind == MediaKind.VIDEO:
+            self.preview.show_media(media.widget, video_player=media.player, media_path=media_path,
+                                    thumbnail_media_player=media_player)
+        else:
+            self.preview.show_media(media.widget, media_path=media_path)
 
     def handle_vote(self, vote, vote_count):
         """Handle voting for a media item. vote_count>1 applies a stronger single update."""
-        if not self.current_pair.is_loaded:
+        if vote == "left":
+            self._cast_vote(self.left_frame, self.current_pair.left_data,
+                            self.current_pair.right_data, vote_count)
+        else:
+            self._cast_vote(self.right_frame, self.current_pair.right_data,
+                            self.current_pair.left_data, vote_count)
+
+    def _vote_left(self):
+        self._cast_vote(self.left_frame, self.current_pair.left_data,
+                        self.current_pair.right_data, 1)
+
+    def _vote_right(self):
+        self._cast_vote(self.right_frame, self.current_pair.right_data,
+                        self.current_pair.left_data, 1)
+
+    def _double_vote_left(self):
+        self._cast_vote(self.left_frame, self.current_pair.left_data,
+                        self.current_pair.right_data, 2)
+
+    def _double_vote_right(self):
+        self._cast_vote(self.right_frame, self.current_pair.right_data,
+                        self.current_pair.left_data, 2)
+
+    def _cast_vote(self, winner_frame, winner, loser, vote_count):
+        """Record a vote for winner over loser and advance to the next pair."""
+        if not self.current_pair.is_loaded or self.current_pair.album_id != self.active_album_id:
             return
 
         if self._on_cooldown:
             return
 
-        self.last_vote_time = time.time()
         self._on_cooldown = True
         self.left_frame.set_cooldown_style(True)
         self.right_frame.set_cooldown_style(True)
 
-        # Flash the winning frame
-        if vote == "left":
-            winner = self.current_pair.left_data
-            loser = self.current_pair.right_data
-            self.left_frame.flash_winner()
-        else:
-            winner = self.current_pair.right_data
-            loser = self.current_pair.left_data
-            self.right_frame.flash_winner()
+        # Flash the winning frame; its flash_done swaps in the next pair
+        winner_frame.flash_winner()
 
-        # Single DB write: weight amplifies the rating delta without rematch rows
+        # Single DB write: weight amplifies the rating delta without rematch rows.
+        # The write is queued on the vote writer thread; on_vote_applied follows.
         self.update_ratings_callback(
             winner[0], loser[0], self.active_album_id, weight=vote_count
         )
 
-        self.ranking_tab.set_new_votes_flag()
         self.total_votes += 1
-        if self.rating_system != "elo" and self.get_mean_glicko_phi:
-            self.mean_phi = self.get_mean_glicko_phi(self.active_album_id)
+        self._votes_cast += 1
 
-        # Delay the pair replacement
-        QTimer.singleShot(150, self._replace_current_pair)
+        self.reliability_update_timer.start()
 
-        # Cap cooldown at vote_cooldown; end early once the next pair is ready
-        self.cooldown_timer.start(int(self.vote_cooldown * 1000))
-        self.update_reliability_info()
+    def on_vote_applied(self, album_id: int, mean_phi=None):
+        """
+        Called once a vote has been committed to the database.
 
+        Args:
+            album_id: Album the vote belongs to
+            mean_phi: Album mean Glicko RD read back after the write (None for Elo)
+        """
+        self.ranking_tab.set_new_votes_flag()
         if self.history_tab:
             self.history_tab.set_needs_refresh()
+        if album_id != self.active_album_id:
+            return
+        if self._vote_error_shown:
+            self._vote_error_shown = False
+            self.status_label.setText("")
+        if mean_phi is not None:
+            self.mean_phi = mean_phi
+            self.reliability_update_timer.start()
+
+    def on_vote_failed(self, album_id: int, message: str):
+        """
+        Called when a queued vote could not be written; undoes its local count.
+
+        Args:
+            album_id: Album the vote belongs to
+            message: Error reported by the database
+        """
+        # Every outstanding stats request was queued after this vote and
+        # counted it, but its answer will not include it
+        self._votes_cast -= 1
+        self._stats_vote_marks = deque(mark - 1 for mark in self._stats_vote_marks)
+        if album_id != self.active_album_id:
+            return
+        self.total_votes -= 1
+        self.reliability_update_timer.start()
+        self.status_label.setText(f"Vote could not be saved: {message}")
+        self._vote_error_shown = True
 
     def _replace_current_pair(self):
         """Replace current pair with preloaded pair"""
@@ -571,28 +995,29 @@ class VotingTab(QWidget):
             self.current_pair.cleanup()
             self.current_pair, self.next_pair = self.next_pair, self.current_pair
             self._display_current_pair()
-
-            # Schedule preload with a slight delay
-            self.delayed_preload_timer.start(100)
-            # Next pair already shown — release cooldown early
+            self.delayed_preload_timer.start()
+            # Next pair already shown — release cooldown
             self.end_cooldown()
+        elif self.next_pair.is_loading or 'next' in self._pair_requests:
+            # Swap as soon as the background selection and decode finish; keep
+            # the cooldown up so the outgoing pair cannot be voted on again
+            self._swap_pending = True
         else:
-            # If next pair isn't loaded, load new pair
+            # If next pair isn't loaded, load a new one; the cooldown ends
+            # once it is shown (or the album turns out to be empty)
             self.load_new_pair()
-            self.end_cooldown()
 
     def end_cooldown(self):
         """End the cooldown period and revert button styles."""
         self._on_cooldown = False
         self.left_frame.set_cooldown_style(False)
         self.right_frame.set_cooldown_style(False)
-        if self.cooldown_timer.isActive():
-            self.cooldown_timer.stop()
 
     def ensure_images_loaded(self):
         """Load images if they haven't been loaded yet."""
-        if not self.images_loaded:
-            self.load_new_pair()
+        if (not self.images_loaded and not self.current_pair.is_loading
+                and 'current' not in self._pair_requests):
+            self.pair_load_timer.start()
 
     def enable_voting(self):
         """Enable voting buttons."""
@@ -608,7 +1033,8 @@ class VotingTab(QWidget):
 
     def _finish_preload(self):
         """Called when preload is complete"""
-        if self.next_pair.is_loaded:
+        # During a cooldown the buttons stay locked; end_cooldown() restores them
+        if not self._on_cooldown:
             self.enable_voting()
 
     def handle_delete(self, side):
@@ -642,7 +1068,9 @@ class VotingTab(QWidget):
         if msg.exec() == QMessageBox.StandardButton.Yes:
             self._handle_media_deletion(media_id, file_path, delete_file_checkbox.isChecked())
             self._show_deletion_errors()
-            # Load new pair after deletion
+            # Neither pair may be voted on or swapped in once an item in it
+            # is gone; voting resumes when the replacement pair is shown
+            self._discard_pairs()
             self.load_new_pair()
 
     def _delete_file(self, file_path: str) -> bool:
@@ -683,16 +1111,15 @@ class VotingTab(QWidget):
         """Release all resources associated with a media file."""
         # Stop any video players or GIF movies
         for frame in [self.left_frame, self.right_frame]:
-            if hasattr(frame, 'media_player') and frame.media_player:
+            if frame.media_player:
                 frame.media_player.stop()
-            if hasattr(frame, 'gif_movie') and frame.gif_movie:
+            if frame.gif_movie:
                 frame.gif_movie.stop()
-        
+
         # Close preview if it's showing this file
-        if hasattr(self, 'preview') and self.preview.isVisible():
-            if hasattr(self.preview, 'current_media_path'):
-                if self.preview.current_media_path == file_path:
-                    self.preview.close()
+        if (self.preview is not None and self.preview.isVisible()
+                and self.preview.current_media_path == file_path):
+            self.preview.close()
 
     def _handle_media_deletion(self, media_id: int, file_path: str, delete_file: bool, recalculate: bool = True):
         """
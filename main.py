@@ -7,7 +7,7 @@ from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication, QMessageBox, QProgressDialog
 
 from core.media_handler import MediaHandler
-from core.media_workers import MissingFilesScanWorker
+from core.media_workers import MissingFilesScanWorker, VotingDatabaseWorker
 from db.database import Database
 from gui.history_tab import HistoryTab
 from gui.main_window import MainWindow
@@ -69,6 +69,10 @@ class Application:
         # Initialize database
         self.db = Database()
 
+        # Votes are committed and voting pairs selected on a dedicated
+        # thread with its own connection
+        self.voting_db_worker = VotingDatabaseWorker(self.db.db_path)
+
         # Initialize media handler
         self.media_handler = MediaHandler()
 
@@ -104,7 +108,7 @@ class Application:
             self.db
         )
         self.voting_tab = VotingTab(
-            self.get_pair_for_voting,
+            self.request_pair_for_voting,
             self.update_ratings,
             self.media_handler,
             self.ranking_tab,
@@ -112,10 +116,17 @@ class Application:
             self.get_total_votes,
             get_album_rating_system=self.db.get_album_rating_system,
             get_mean_glicko_phi=self.db.get_mean_glicko_phi,
+            has_media_type=self.db.has_media_type,
+            request_album_stats=self.voting_db_worker.request_album_stats,
         )
 
         # Set history tab reference in voting tab
         self.voting_tab.set_history_tab(self.history_tab)
+        self.voting_db_worker.vote_applied.connect(self.voting_tab.on_vote_applied)
+        self.voting_db_worker.vote_failed.connect(self.voting_tab.on_vote_failed)
+        self.voting_db_worker.pair_ready.connect(self.voting_tab.on_pair_fetched)
+        self.voting_db_worker.album_stats_ready.connect(self.voting_tab.on_album_stats_fetched)
+        self.voting_db_worker.start()
 
         self.upload_tab = LoadTab(
             self.add_media_to_db,
@@ -267,13 +278,13 @@ class Application:
         )
 
 
-    def get_pair_for_voting(self, album_id: int = 1):
-        """Get a pair of media items for voting from specified album."""
-        return self.db.get_pair_for_voting(album_id)
+    def request_pair_for_voting(self, request_id: int, album_id: int = 1):
+        """Queue selection of a voting pair; the voting tab gets it via on_pair_fetched."""
+        self.voting_db_worker.request_pair(request_id, album_id)
 
     def update_ratings(self, winner_id: int, loser_id: int, album_id: int, weight: int = 1):
-        """Update ratings after a vote (weight amplifies a single edge)."""
-        self.db.update_ratings(winner_id, loser_id, album_id, weight=weight)
+        """Queue a vote for the database thread (weight amplifies a single edge)."""
+        self.voting_db_worker.submit(winner_id, loser_id, album_id, weight=weight)
 
     def run(self):
         """Start the application."""
@@ -284,6 +295,8 @@ class Application:
 
     def cleanup(self):
         """Clean up resources before exit."""
+        # Flush votes that are still queued before closing the database
+        self.voting_db_worker.stop()
         self.db.close()
 
 
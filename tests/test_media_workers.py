@@ -0,0 +1,77 @@
+"""
+Unit tests for the voting database worker's queue ordering.
+"""
+import pytest
+
+from core.media_workers import VotingDatabaseWorker
+from db.database import Database
+
+
+@pytest.fixture
+def album(tmp_path):
+    path = str(tmp_path / "test.db")
+    database = Database(path)
+    album_id = database.create_album("Test", "glicko2")
+    for i in range(4):
+        fpath = str(tmp_path / f"img_{i}.jpg")
+        open(fpath, "wb").close()
+        database.add_media(fpath, "image", album_id)
+    media_ids = [row[0] for row in database.cursor.execute(
+        "SELECT id FROM media WHERE album_id = ? ORDER BY id", (album_id,))]
+    database.close()
+    return path, album_id, media_ids
+
+
+def run_until_drained(worker):
+    """Serve everything queued so far on the calling thread"""
+    worker._queue.put(None)
+    worker.run()
+
+
+class TestVotingDatabaseWorker:
+    def test_vote_is_committed_before_pair_is_selected(self, album):
+        path, album_id, media_ids = album
+        worker = VotingDatabaseWorker(path)
+        events = []
+        worker.vote_applied.connect(lambda album, mean_phi: events.append("vote"))
+
+        def on_pair_ready(request_id, album, pair):
+            reader = Database(path)
+            events.append(("pair", request_id, reader.get_total_votes(album)))
+            reader.close()
+        worker.pair_ready.connect(on_pair_ready)
+
+        worker.submit(media_ids[0], media_ids[1], album_id)
+        worker.request_pair(7, album_id)
+        worker.submit(media_ids[2], media_ids[3], album_id)
+        run_until_drained(worker)
+
+        assert events == ["vote", ("pair", 7, 1), "vote"]
+
+    def test_stats_include_earlier_votes(self, album):
+        path, album_id, media_ids = album
+        worker = VotingDatabaseWorker(path)
+        stats = []
+        worker.album_stats_ready.connect(lambda album, counts: stats.append(counts))
+
+        worker.submit(media_ids[0], media_ids[1], album_id, weight=2)
+        worker.request_album_stats(album_id)
+        run_until_drained(worker)
+
+        assert stats[0]['total_votes'] == 1
+        assert stats[0]['total_media'] == 4
+        assert stats[0]['mean_phi'] is not None
+
+    def test_failed_vote_is_reported(self, album):
+        path, album_id, media_ids = album
+        worker = VotingDatabaseWorker(path)
+        applied, failed = [], []
+        worker.vote_applied.connect(lambda album, mean_phi: applied.append(album))
+        worker.vote_failed.connect(lambda album, message: failed.append(album))
+
+        worker.submit(media_ids[0], media_ids[1], album_id)
+        worker.submit(media_ids[0], -1, album_id)
+        run_until_drained(worker)
+
+        assert applied == [album_id]
+        assert failed == [album_id]
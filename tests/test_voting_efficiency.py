@@ -7,6 +7,7 @@ from typing import List, Set, Tuple
 
 import pytest
 
+from core.elo import Rating, elo_update
 from core.glicko2 import Glicko2Rating
 from core.reliability_calculator import ReliabilityCalculator
 from db.database import Database
@@ -140,6 +141,14 @@ class TestReliabilityCalibration:
         )
         assert settled > base
 
+    def test_required_votes_cache_ignores_small_phi_moves(self):
+        """Consecutive Glicko votes move mean phi slightly; they share one answer."""
+        ReliabilityCalculator._required_votes.cache_clear()
+        for mean_phi in (200.31, 200.27, 199.86):
+            ReliabilityCalculator.calculate_required_votes(300, 94, "glicko2", mean_phi)
+        info = ReliabilityCalculator._required_votes.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
     def test_old_curve_overshoot_fixed(self):
         """Previous formula needed ~20 votes/item for 94%; new curve needs far less."""
         n = 100
@@ -164,6 +173,15 @@ class TestGlickoSigma:
         assert result["b"]["mu"] < 1200
 
 
+class TestEloUpdate:
+    def test_matches_rating_class(self):
+        for a, b, k in [(1200, 1200, 32), (1400, 1100, 16), (900, 1500, 64)]:
+            expected = Rating(a, b, Rating.WIN, Rating.LOST, k).get_new_ratings()
+            new_a, new_b = elo_update(a, b, k)
+            assert new_a == pytest.approx(expected["a"])
+            assert new_b == pytest.approx(expected["b"])
+
+
 class TestPairing:
     @pytest.fixture
     def db(self, tmp_path):
@@ -196,6 +214,34 @@ class TestPairing:
         database.update_ratings(left[0], right[0], album_id, weight=2)
         assert database.get_total_votes(album_id) == 1
 
+    def test_batch_matches_sequential_updates(self, db, tmp_path):
+        database, album_id = db
+        other = Database(str(tmp_path / "sequential.db"))
+        other_album = other.create_album("Test", "glicko2")
+        for i in range(8):
+            other.add_media(str(tmp_path / f"img_{i}.jpg"), "image", other_album)
+        ids = [row[0] for row in database.cursor.execute(
+            "SELECT id FROM media WHERE album_id = ? ORDER BY id", (album_id,))]
+        other_ids = [row[0] for row in other.cursor.execute(
+            "SELECT id FROM media WHERE album_id = ? ORDER BY id", (other_album,))]
+        pairs = [(0, 1, 1), (2, 0, 2), (1, 3, 1), (0, 3, 1)]
+
+        database.update_ratings_batch(
+            [(ids[w], ids[l], album_id, weight) for w, l, weight in pairs]
+        )
+        for w, l, weight in pairs:
+            other.update_ratings(other_ids[w], other_ids[l], other_album, weight=weight)
+
+        batched = database.cursor.execute(
+            "SELECT rating, glicko_phi, votes FROM media WHERE album_id = ? ORDER BY id",
+            (album_id,)).fetchall()
+        sequential = other.cursor.execute(
+            "SELECT rating, glicko_phi, votes FROM media WHERE album_id = ? ORDER BY id",
+            (other_album,)).fetchall()
+        other.close()
+        assert batched == sequential
+        assert database.get_total_votes(album_id) == len(pairs)
+
     def test_glicko_recalc_resets_votes(self, db):
         database, album_id = db
         left, right = database.get_pair_for_voting(album_id)
@@ -206,6 +252,33 @@ class TestPairing:
         )
         assert database.cursor.fetchone()[0] == 1
 
+    def test_elo_recalc_leaves_other_albums_alone(self, db, tmp_path):
+        database, album_id = db
+        elo_album = database.create_album("Elo", "elo")
+        for i in range(4):
+            fpath = str(tmp_path / f"elo_{i}.jpg")
+            open(fpath, "wb").close()
+            database.add_media(fpath, "image", elo_album)
+        left, right = database.get_pair_for_voting(album_id)
+        database.update_ratings(left[0], right[0], album_id)
+        glicko_before = database.cursor.execute(
+            "SELECT rating, votes FROM media WHERE album_id = ? ORDER BY id", (album_id,)
+        ).fetchall()
+
+        elo_left, elo_right = database.get_pair_for_voting(elo_album)
+        database.update_ratings(elo_left[0], elo_right[0], elo_album)
+        database._recalculate_elo(elo_album)
+
+        assert database.cursor.execute(
+            "SELECT rating, votes FROM media WHERE album_id = ? ORDER BY id", (album_id,)
+        ).fetchall() == glicko_before
+        database.cursor.execute(
+            "SELECT rating, votes FROM media WHERE id = ?", (elo_left[0],)
+        )
+        rating, votes = database.cursor.fetchone()
+        assert rating == pytest.approx(1216.0)
+        assert votes == 1
+
 
 class TestPairingEfficiency:
     def test_smart_pairing_reaches_threshold_with_fewer_votes(self):
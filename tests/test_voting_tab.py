@@ -0,0 +1,224 @@
+"""
+Display-free tests for the voting tab's pair bookkeeping: swapping the
+preloaded pair in after a vote, routing background pair selections and
+discarding pairs that may no longer be voted on.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication, QMessageBox
+
+from core.media_handler import MediaHandler
+from gui.voting_tab import VotingTab
+
+ALBUM_ID = 1
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+class FakeRanking:
+    def __init__(self):
+        self.deleted = []
+
+    def set_new_votes_flag(self):
+        pass
+
+    def delete_callback(self, media_id, recalculate=True):
+        self.deleted.append(media_id)
+
+
+class TabHarness:
+    """A VotingTab whose pair selections and vote writes are recorded"""
+
+    def __init__(self):
+        self.votes = []
+        self.pair_requests = []
+        self.ranking = FakeRanking()
+        self.tab = VotingTab(
+            lambda request_id, album_id: self.pair_requests.append(request_id),
+            lambda winner, loser, album_id, weight=1: self.votes.append((winner, loser)),
+            MediaHandler(), self.ranking, lambda album_id: 4, lambda album_id: 0)
+        self.tab.active_album_id = ALBUM_ID
+
+    @staticmethod
+    def make_loaded(pair, left_id, right_id, album_id=ALBUM_ID):
+        """Mark pair as decoded without touching the disk"""
+        pair.album_id = album_id
+        pair.left_data = (left_id, f"{left_id}.png", 1200.0, 0)
+        pair.right_data = (right_id, f"{right_id}.png", 1200.0, 0)
+        for side in ("left_media", "right_media"):
+            pixmap = QPixmap(4, 4)
+            pixmap.fill()
+            setattr(pair, side, pixmap)
+        pair.is_loaded = True
+
+    def vote_left(self):
+        """Vote and swap in the next pair without waiting for the flash"""
+        self.tab.handle_vote("left", 1)
+        self.tab._replace_current_pair()
+
+
+@pytest.fixture
+def harness(app):
+    harness = TabHarness()
+    yield harness
+    harness.tab.deleteLater()
+
+
+class TestPairSwap:
+    def test_outgoing_pair_is_not_swapped_back(self, harness):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+        harness.make_loaded(tab.next_pair, 3, 4)
+
+        harness.vote_left()
+        assert tab.current_pair.left_data[0] == 3
+        assert not tab.next_pair.is_loaded
+
+        # The preload for the following pair is still being selected
+        tab._start_preload()
+        harness.vote_left()
+        assert tab._swap_pending
+        assert tab._on_cooldown
+        assert tab.current_pair.left_data[0] == 3
+
+        # Voting stays locked until the next pair is on screen
+        tab.handle_vote("left", 1)
+        assert harness.votes == [(1, 2), (3, 4)]
+
+    def test_pending_swap_completes_when_next_pair_loads(self, harness):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+        tab._start_preload()
+
+        harness.vote_left()
+        assert tab._swap_pending
+
+        harness.make_loaded(tab.next_pair, 3, 4)
+        tab.next_pair.loaded.emit()
+        assert not tab._swap_pending
+        assert not tab._on_cooldown
+        assert tab.current_pair.left_data[0] == 3
+
+        harness.vote_left()
+        assert harness.votes == [(1, 2), (3, 4)]
+
+    def test_preload_during_flash_keeps_buttons_locked(self, harness):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+        tab._start_preload()
+
+        tab.handle_vote("left", 1)  # Winner flash still running
+        harness.make_loaded(tab.next_pair, 3, 4)
+        tab.next_pair.loaded.emit()
+        assert not tab.left_frame.vote_button.isEnabled()
+
+        tab._replace_current_pair()
+        assert tab.left_frame.vote_button.isEnabled()
+        assert tab.current_pair.left_data[0] == 3
+
+
+class TestPairRequests:
+    def test_replaced_request_is_ignored(self, harness):
+        tab = harness.tab
+        tab._start_preload()
+        stale_id = harness.pair_requests[-1]
+        tab._start_preload()
+
+        tab.on_pair_fetched(stale_id, ALBUM_ID, None)
+        assert tab._pair_requests == {'next': harness.pair_requests[-1]}
+        tab.on_pair_fetched(harness.pair_requests[-1], ALBUM_ID, None)
+        assert tab._pair_requests == {}
+
+    def test_album_switch_cancels_requests(self, harness):
+        tab = harness.tab
+        tab._start_preload()
+        request_id = harness.pair_requests[-1]
+        tab.set_active_album(ALBUM_ID + 1)
+
+        tab.on_pair_fetched(request_id, ALBUM_ID, None)
+        assert 'next' not in tab._pair_requests
+        assert not tab.next_pair.is_loading
+
+
+class TestDiscardedPairs:
+    def test_album_switch_locks_voting(self, harness):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+
+        tab.set_active_album(ALBUM_ID + 1)
+        tab.handle_vote("left", 1)
+        assert harness.votes == []
+        assert not tab.left_frame.vote_button.isEnabled()
+
+    def test_deleted_pair_cannot_be_voted_on(self, harness, monkeypatch):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+        monkeypatch.setattr(QMessageBox, "exec", lambda msg: QMessageBox.StandardButton.Yes)
+
+        tab.handle_delete("left")
+        assert harness.ranking.deleted == [1]
+        assert tab._pair_requests  # The replacement pair is being selected
+
+        tab.handle_vote("left", 1)
+        assert harness.votes == []
+
+    def test_pair_from_another_album_is_not_voted_on(self, harness):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+
+        tab.active_album_id = ALBUM_ID + 1
+        tab.handle_vote("left", 1)
+        assert harness.votes == []
+
+    def test_cooldown_ends_when_new_album_pair_is_shown(self, harness):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+        tab.handle_vote("left", 1)
+
+        tab.set_active_album(ALBUM_ID + 1)
+        harness.make_loaded(tab.current_pair, 5, 6, album_id=ALBUM_ID + 1)
+        tab.current_pair.loaded.emit()
+        assert not tab._on_cooldown
+
+        tab.handle_vote("left", 1)
+        assert harness.votes == [(1, 2), (5, 6)]
+
+
+class TestVoteFailure:
+    def test_failed_vote_is_rolled_back(self, harness):
+        tab = harness.tab
+        harness.make_loaded(tab.current_pair, 1, 2)
+        tab._display_current_pair()
+        tab.total_votes = 10
+        tab.handle_vote("left", 1)
+        tab._stats_vote_marks.append(tab._votes_cast)  # Stats requested after the vote
+
+        tab.on_vote_failed(ALBUM_ID, "database is locked")
+        assert tab.total_votes == 10
+        assert tab._votes_cast == 0
+        assert "database is locked" in tab.status_label.text()
+
+        # The stats answer does not include the failed vote either
+        tab.on_album_stats_fetched(ALBUM_ID, {
+            'total_media': 4, 'total_votes': 10, 'rating_system': 'glicko2',
+            'mean_phi': None, 'has_videos': False,
+        })
+        assert tab.total_votes == 10
+
+        tab.on_vote_applied(ALBUM_ID)
+        assert tab.status_label.text() == ""